@@ -0,0 +1,275 @@
+# Name: Stefan Law
+# Course: CS261 - Data Structures
+# Description: Bloom filter (classic or cache-line blocked) and a Bloom
+# filter front end for the open addressing HashMap. The filter is updated on
+# every put and answers most lookups of absent keys without walking a
+# quadratic probe sequence. Bloom filters cannot delete, so the filter is
+# rebuilt from the live keys on resize_table, and also once removed keys
+# outnumber live ones.
+
+from math import ceil, log
+
+import hash_map_oa
+from a6_include import hash_function_1
+
+
+class BloomFilter:
+    """
+    Bit-array Bloom filter sized for an expected number of keys and a target
+    false positive rate. In blocked mode all k bits of a key fall in one
+    512-bit (64-byte) block, so a query touches a single cache line at the
+    cost of a slightly higher false positive rate.
+    Supported methods are: add, might_contain, clear, get_num_bits,
+    get_num_hashes
+    """
+
+    BLOCK_BITS = 512
+
+    def __init__(self,
+                 expected: int,
+                 fp_rate: float = 0.01,
+                 blocked: bool = False) -> None:
+        """
+        Initialize an empty filter.
+
+        :param expected: number of keys the filter is sized for
+        :param fp_rate: target false positive rate at that many keys
+        :param blocked: use the cache-line blocked layout
+        """
+        expected = max(expected, 1)
+        bits = ceil(-expected * log(fp_rate) / log(2) ** 2)
+        self._blocked = blocked
+        if blocked:
+            self._blocks = max(1, ceil(bits / self.BLOCK_BITS))
+            bits = self._blocks * self.BLOCK_BITS
+        self._num_bits = bits
+        self._num_hashes = max(1, round(bits / expected * log(2)))
+        self._bits = bytearray((bits + 7) // 8)
+
+    def get_num_bits(self) -> int:
+        """Return size of the bit array."""
+        return self._num_bits
+
+    def get_num_hashes(self) -> int:
+        """Return number of bits set per key."""
+        return self._num_hashes
+
+    def _positions(self, key: str):
+        """
+        Yield the bit positions of key, derived by double hashing the two
+        32-bit halves of Python's (SipHash) string hash. The sample hash
+        functions are not used: keys they cannot tell apart would always
+        share their bits.
+        """
+        key_hash = hash(key) & 0xFFFFFFFFFFFFFFFF
+        hash_1 = key_hash & 0xFFFFFFFF
+        hash_2 = (key_hash >> 32) | 1
+        if self._blocked:
+            base = (hash_1 % self._blocks) * self.BLOCK_BITS
+            for i in range(self._num_hashes):
+                yield base + (((hash_2 >> 9) + i * hash_2) & (self.BLOCK_BITS - 1))
+        else:
+            for i in range(self._num_hashes):
+                yield (hash_1 + i * hash_2) % self._num_bits
+
+    def add(self, key: str) -> None:
+        """Set the bits of key."""
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, key: str) -> bool:
+        """
+        Return False if key was definitely never added, True if it may have
+        been (with probability of error about fp_rate).
+        """
+        for position in self._positions(key):
+            if not self._bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        """Support the `in` operator through might_contain."""
+        return self.might_contain(key)
+
+    def clear(self) -> None:
+        """Reset every bit."""
+        self._bits = bytearray(len(self._bits))
+
+
+class BloomHashMap(hash_map_oa.HashMap):
+    """
+    Open addressing HashMap with a Bloom filter in front of get and
+    contains_key. Keeps counters of lookups answered by the filter alone
+    (negatives), lookups that found the key (hits) and lookups the filter let
+    through for absent keys (false positives).
+    """
+
+    def __init__(self,
+                 capacity: int,
+                 function,
+                 fp_rate: float = 0.01,
+                 blocked: bool = False) -> None:
+        """
+        Initialize new HashMap that uses quadratic probing for collision
+        resolution and a Bloom filter for negative lookups.
+
+        :param fp_rate: target false positive rate of the filter
+        :param blocked: use a cache-line blocked filter
+        """
+        super().__init__(capacity, function)
+        self._fp_rate = fp_rate
+        self._blocked = blocked
+        self._filter = self._new_filter(self._capacity)
+        self._removed = 0
+        self._negatives = 0
+        self._hits = 0
+        self._false_positives = 0
+
+    def _new_filter(self, capacity: int) -> BloomFilter:
+        """Return an empty filter sized for a table of capacity at load 0.5."""
+        return BloomFilter(capacity // 2 + 1, self._fp_rate, self._blocked)
+
+    def rebuild_filter(self) -> None:
+        """Rebuild the filter from the live keys, dropping removed ones."""
+        self._filter = self._new_filter(self._capacity)
+        for entry in self:
+            self._filter.add(entry.key)
+        self._removed = 0
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Add key/value pair to HashMap (see HashMap.put) and to the filter.
+
+        :param: key (string)
+        :param: value (object of any type)
+        :return: None
+        """
+        super().put(key, value)
+        self._filter.add(key)
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resize table to new_capacity (see HashMap.resize_table). The filter
+        is replaced by one sized for the new capacity, which the rehashing
+        puts fill with the live keys only.
+
+        :param: new_capacity(integer)
+        :return: None
+        """
+        if new_capacity < self._size:
+            return
+        self._filter = self._new_filter(new_capacity)
+        self._removed = 0
+        super().resize_table(new_capacity)
+
+    def get(self, key: str) -> object:
+        """
+        Return value associated with key, or None. Keys rejected by the
+        filter are answered without probing the table.
+
+        :param: key (string)
+        :return: value(object of any type) if key is found, otherwise None
+        """
+        if not self._filter.might_contain(key):
+            self._negatives += 1
+            return None
+        value = super().get(key)
+        if value is None and not super().contains_key(key):
+            self._false_positives += 1
+        else:
+            self._hits += 1
+        return value
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Return True if key is in the HashMap, otherwise False. Keys rejected
+        by the filter are answered without probing the table.
+
+        :param: key (string)
+        :return: bool
+        """
+        if not self._filter.might_contain(key):
+            self._negatives += 1
+            return False
+        if super().contains_key(key):
+            self._hits += 1
+            return True
+        self._false_positives += 1
+        return False
+
+    def remove(self, key: str) -> None:
+        """
+        Remove key from the HashMap (see HashMap.remove). Its filter bits
+        stay set until the next rebuild, which happens once removed keys
+        outnumber live ones.
+
+        :param: key (string)
+        :return: None
+        """
+        size = self._size
+        super().remove(key)
+        if self._size < size:
+            self._removed += 1
+            if self._removed > self._size:
+                self.rebuild_filter()
+
+    def clear(self) -> None:
+        """
+        Clears the HashMap and its filter.
+
+        :param: None
+        :return: None
+        """
+        super().clear()
+        self._filter = self._new_filter(self._capacity)
+        self._removed = 0
+
+    def filter_stats(self) -> dict:
+        """
+        Return the filter counters: negatives (lookups answered by the filter
+        alone), hits, false_positives and the observed false_positive_rate
+        among absent keys.
+        """
+        absent = self._negatives + self._false_positives
+        return {
+            'negatives': self._negatives,
+            'hits': self._hits,
+            'false_positives': self._false_positives,
+            'false_positive_rate': self._false_positives / absent if absent else 0.0,
+        }
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nBloomFilter")
+    print("-----------")
+    for blocked in (False, True):
+        bloom = BloomFilter(10000, 0.01, blocked)
+        for i in range(10000):
+            bloom.add('key' + str(i))
+        missing = all('key' + str(i) in bloom for i in range(10000))
+        false_positives = sum('miss' + str(i) in bloom for i in range(100000))
+        print(blocked, bloom.get_num_bits(), bloom.get_num_hashes(), missing,
+              false_positives / 100000)
+
+    print("\nBloomHashMap - mostly-miss lookups")
+    print("----------------------------------")
+    m = BloomHashMap(53, hash_function_1)
+    for i in range(2000):
+        m.put('key' + str(i), i)
+    result = True
+    for i in range(2000):
+        result &= m.get('key' + str(i)) == i
+    for i in range(20000):
+        result &= not m.contains_key('miss' + str(i))
+    print(result, m.get_size(), m.get_capacity(), m.filter_stats())
+
+    for i in range(0, 2000, 2):
+        m.remove('key' + str(i))
+    m.remove('key1')
+    print(m.get_size(), m.contains_key('key0'), m.contains_key('key3'),
+          m.get('key1'))
+    m.resize_table(10000)
+    print(m.get_size(), m.get_capacity(), m.get('key3'), m.contains_key('key2'))
@@ -0,0 +1,406 @@
+# Name: Stefan Law
+# Course: CS261 - Data Structures
+# Description: Shared benchmark harness for the HashMap implementations
+# (separate chaining, open addressing, cuckoo and swiss tables). Each
+# implementation runs the same reproducible workloads (seeded key streams)
+# in a fresh worker process, and the harness reports throughput, per-op
+# latency percentiles, peak RSS and bytes per entry. Results can be saved
+# as a baseline and later runs compared against it to catch regressions.
+#
+# Run from this directory, e.g.:
+#   python hash_map_bench.py
+#   python hash_map_bench.py -n 20000 --impl sc cuckoo --save baseline.json
+#   python hash_map_bench.py --compare baseline.json --tolerance 0.15
+#   python hash_map_bench.py --probing -n 20000
+
+import argparse
+import json
+import random
+import string
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
+from multiprocessing import get_context
+
+try:
+    import resource
+except ImportError:     # not available on Windows
+    resource = None
+
+import bloom_filter
+import hash_map_cuckoo
+import hash_map_oa
+import hash_map_sc
+import swiss_table
+from a6_include import hash_function_2
+
+
+# Name -> factory taking an initial capacity. The chaining and probing maps
+# use hash_function_2; the cuckoo map uses its default hash_function_1 /
+# hash_function_2 pair.
+IMPLEMENTATIONS = {
+    'sc': lambda capacity: hash_map_sc.HashMap(capacity, hash_function_2),
+    'sc_pooled': lambda capacity: hash_map_sc.PooledHashMap(
+        capacity, hash_function_2),
+    'oa': lambda capacity: hash_map_oa.HashMap(capacity, hash_function_2),
+    'oa_ordered': lambda capacity: hash_map_oa.OrderedHashMap(
+        capacity, hash_function_2),
+    'oa_bloom': lambda capacity: bloom_filter.BloomHashMap(
+        capacity, hash_function_2),
+    'cuckoo': lambda capacity: hash_map_cuckoo.HashMap(capacity),
+    'swiss': lambda capacity: swiss_table.HashMap(capacity, hash_function_2),
+}
+
+
+# ------------------------- WORKLOADS -------------------------------------- #
+#
+# A workload receives the entry count n and a seeded random.Random, and
+# returns (preload, ops): preload is a list of (key, value) pairs inserted
+# before timing starts, and ops is the timed list of (op, key, value)
+# tuples, where op is one of 'put', 'get', 'contains_key' or 'remove'.
+
+def _random_keys(rng: random.Random, count: int,
+                 min_len: int = 8, max_len: int = 16) -> list:
+    """Return count distinct random lowercase keys of the given lengths."""
+    keys = {}
+    while len(keys) < count:
+        length = rng.randint(min_len, max_len)
+        keys[''.join(rng.choices(string.ascii_lowercase, k=length))] = None
+    return list(keys)
+
+
+def _zipf_cum_weights(count: int, s: float = 1.1) -> list:
+    """Return cumulative Zipf(s) weights over ranks 1..count."""
+    cum_weights, total = [], 0.0
+    for rank in range(1, count + 1):
+        total += 1 / rank ** s
+        cum_weights.append(total)
+    return cum_weights
+
+
+def uniform_reads(n: int, rng: random.Random) -> tuple[list, list]:
+    """n lookups of keys drawn uniformly from n preloaded keys."""
+    keys = _random_keys(rng, n)
+    preload = [(key, i) for i, key in enumerate(keys)]
+    ops = [('get', rng.choice(keys), None) for _ in range(n)]
+    return preload, ops
+
+
+def zipf_reads(n: int, rng: random.Random) -> tuple[list, list]:
+    """n lookups of preloaded keys with Zipf-distributed popularity."""
+    keys = _random_keys(rng, n)
+    preload = [(key, i) for i, key in enumerate(keys)]
+    picks = rng.choices(keys, cum_weights=_zipf_cum_weights(n), k=n)
+    ops = [('get', key, None) for key in picks]
+    return preload, ops
+
+
+def insert_heavy(n: int, rng: random.Random) -> tuple[list, list]:
+    """90% inserts of new keys, 10% lookups, on top of n / 10 keys."""
+    keys = _random_keys(rng, n + n // 10)
+    preload = [(key, i) for i, key in enumerate(keys[:n // 10])]
+    ops, inserted = [], keys[:n // 10]
+    for i, key in enumerate(keys[n // 10:]):
+        ops.append(('put', key, i))
+        inserted.append(key)
+        if i % 9 == 8:
+            ops.append(('get', rng.choice(inserted), None))
+    return preload, ops
+
+
+def delete_churn(n: int, rng: random.Random) -> tuple[list, list]:
+    """Alternate removing a live key and inserting a new one at steady size."""
+    keys = _random_keys(rng, n + n // 2)
+    live = keys[:n // 2]
+    preload = [(key, i) for i, key in enumerate(live)]
+    ops = []
+    for i, key in enumerate(keys[n // 2:]):
+        victim = live.pop(rng.randrange(len(live)))
+        ops.append(('remove', victim, None))
+        ops.append(('put', key, i))
+        live.append(key)
+    return preload, ops
+
+
+def varied_string_keys(n: int, rng: random.Random) -> tuple[list, list]:
+    """Hits and misses on keys between 4 and 256 characters long."""
+    keys = _random_keys(rng, 2 * n, 4, 256)
+    preload = [(key, i) for i, key in enumerate(keys[:n])]
+    ops = [('contains_key', rng.choice(keys), None) for _ in range(n)]
+    return preload, ops
+
+
+def bulk_load(n: int, rng: random.Random) -> tuple[list, list]:
+    """Insert n new keys into an empty map."""
+    keys = _random_keys(rng, n)
+    return [], [('put', key, i) for i, key in enumerate(keys)]
+
+
+def int_keys(n: int, rng: random.Random) -> tuple[list, list]:
+    """Inserts and hits on random integer keys, with no string hashing."""
+    keys = rng.sample(range(1 << 40), n)
+    preload = [(key, i) for i, key in enumerate(keys[:n // 2])]
+    ops = [('put', key, i) for i, key in enumerate(keys[n // 2:])]
+    ops += [('get', rng.choice(keys), None) for _ in range(n)]
+    return preload, ops
+
+
+WORKLOADS = {
+    'uniform_reads': uniform_reads,
+    'zipf_reads': zipf_reads,
+    'insert_heavy': insert_heavy,
+    'delete_churn': delete_churn,
+    'varied_keys': varied_string_keys,
+    'bulk_load': bulk_load,
+    'int_keys': int_keys,
+}
+
+
+# ------------------------- MEASUREMENT ------------------------------------ #
+
+def _percentile(sorted_values: list, fraction: float) -> float:
+    """Return the nearest-rank percentile of an already sorted list."""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def _peak_rss() -> int:
+    """Return the peak resident set size of this process in bytes."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_case(impl: str, workload: str, n: int, seed: int) -> dict:
+    """
+    Run one workload on one implementation and return its metrics. Meant to
+    be executed in a fresh process so that peak RSS belongs to this case.
+
+    :param impl: key of IMPLEMENTATIONS
+    :param workload: key of WORKLOADS
+    :param n: workload size
+    :param seed: random seed for the key stream
+    :return: dict of metrics
+    """
+    factory = IMPLEMENTATIONS[impl]
+    preload, ops = WORKLOADS[workload](n, random.Random(seed))
+
+    m = factory(11)
+    for key, value in preload:
+        m.put(key, value)
+
+    methods = {'put': m.put, 'get': m.get,
+               'contains_key': m.contains_key, 'remove': m.remove}
+    latencies = []
+    clock = time.perf_counter_ns
+    total_start = clock()
+    for op, key, value in ops:
+        method = methods[op]
+        start = clock()
+        if op == 'put':
+            method(key, value)
+        else:
+            method(key)
+        latencies.append(clock() - start)
+    total = (clock() - total_start) / 1e9
+    latencies.sort()
+    peak_rss = _peak_rss()
+
+    # Memory per entry is traced on a separate rebuild of the final contents,
+    # since tracing would distort the timings above
+    contents = m.get_keys_and_values()
+    entries = contents.length()
+    pairs = [contents[i] for i in range(entries)]
+    del m, contents
+    tracemalloc.start()
+    rebuilt = factory(11)
+    for key, value in pairs:
+        rebuilt.put(key, value)
+    traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return {
+        'ops': len(ops),
+        'ops_per_sec': len(ops) / total if total else 0.0,
+        'p50_us': _percentile(latencies, 0.50) / 1000,
+        'p99_us': _percentile(latencies, 0.99) / 1000,
+        'peak_rss_mb': peak_rss / 2 ** 20,
+        'bytes_per_entry': traced / entries if entries else 0.0,
+    }
+
+
+def run_all(impls: list, workloads: list, n: int, seed: int) -> dict:
+    """
+    Run every (implementation, workload) pair, each in its own worker
+    process, and return {"impl/workload": metrics}.
+    """
+    results = {}
+    context = get_context('spawn')
+    for workload in workloads:
+        for impl in impls:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                metrics = pool.submit(run_case, impl, workload, n, seed).result()
+            results[impl + '/' + workload] = metrics
+            print_row(impl + '/' + workload, metrics)
+    return results
+
+
+def print_header() -> None:
+    """Print the column headings of the results table."""
+    print(f"{'case':<26}{'ops/s':>11}{'p50 us':>9}{'p99 us':>9}"
+          f"{'RSS MB':>9}{'B/entry':>9}")
+
+
+def print_row(case: str, metrics: dict) -> None:
+    """Print one row of the results table."""
+    print(f"{case:<26}{metrics['ops_per_sec']:>11.0f}"
+          f"{metrics['p50_us']:>9.2f}{metrics['p99_us']:>9.2f}"
+          f"{metrics['peak_rss_mb']:>9.1f}{metrics['bytes_per_entry']:>9.0f}")
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Compare results against a saved baseline. A case regresses when its
+    throughput drops, or its p99 latency or bytes per entry grow, by more
+    than tolerance (a fraction).
+
+    :return: list of human-readable regression descriptions
+    """
+    regressions = []
+    for case, metrics in results.items():
+        if case not in baseline:
+            continue
+        old = baseline[case]
+        if metrics['ops_per_sec'] < old['ops_per_sec'] * (1 - tolerance):
+            regressions.append(f"{case}: ops/s {old['ops_per_sec']:.0f} -> "
+                               f"{metrics['ops_per_sec']:.0f}")
+        for metric in ('p99_us', 'bytes_per_entry'):
+            if metrics[metric] > old[metric] * (1 + tolerance):
+                regressions.append(f"{case}: {metric} {old[metric]:.2f} -> "
+                                   f"{metrics[metric]:.2f}")
+    return regressions
+
+
+# ------------------------- PROBING SWEEP ---------------------------------- #
+#
+# Lookup cost of each open addressing probe sequence, and of the swiss
+# table's grouped probing, as the table fills. Each map is sized first and
+# then filled to an exact load factor, so no resize happens while timing.
+
+PROBE_LOADS = (0.125, 0.25, 0.375, 0.5, 0.75, 0.875)
+
+
+def _probe_maps() -> dict:
+    """
+    Return name -> (factory taking a capacity, highest load factor it can
+    be filled to without growing).
+    """
+    maps = {}
+    for probing in hash_map_oa.HashMap.PROBING:
+        def factory(capacity, probing=probing):
+            m = hash_map_oa.HashMap(capacity, hash_function_2)
+            m.set_probing(probing)
+            return m
+        maps['oa_' + probing] = (factory, 0.5)
+    maps['swiss_bytes'] = (lambda capacity: swiss_table.HashMap(
+        capacity, hash_function_2, vectorized=False), swiss_table.HashMap.MAX_LOAD)
+    if find_spec('numpy') is not None:
+        maps['swiss_numpy'] = (lambda capacity: swiss_table.HashMap(
+            capacity, hash_function_2, vectorized=True), swiss_table.HashMap.MAX_LOAD)
+    return maps
+
+
+def run_probing(n: int, seed: int) -> dict:
+    """
+    Time successful and unsuccessful gets for every probe strategy at every
+    load factor in PROBE_LOADS it supports, and print one row per pair.
+
+    :param n: table capacity to aim for (entries = load * capacity)
+    :param seed: random seed for the keys
+    :return: {"strategy/load": {'hit_ns': ..., 'miss_ns': ...}}
+    """
+    rng = random.Random(seed)
+    keys = _random_keys(rng, 2 * n)
+    results = {}
+    print(f"{'strategy':<14}{'load':>7}{'hit ns':>10}{'miss ns':>10}")
+    for name, (factory, max_load) in _probe_maps().items():
+        for load in PROBE_LOADS:
+            if load > max_load:
+                continue
+            m = factory(n)
+            count = int(load * m.get_capacity())
+            present, absent = keys[:count], keys[n:n + count]
+            for key in present:
+                m.put(key, None)
+            timings = {}
+            for label, lookups in (('hit_ns', present), ('miss_ns', absent)):
+                get = m.get
+                start = time.perf_counter_ns()
+                for key in lookups:
+                    get(key)
+                timings[label] = (time.perf_counter_ns() - start) / max(1, count)
+            results[name + '/' + str(load)] = timings
+            print(f"{name:<14}{m.table_load():>7.3f}"
+                  f"{timings['hit_ns']:>10.0f}{timings['miss_ns']:>10.0f}")
+    return results
+
+
+def main() -> int:
+    """
+    Parse command line options, run the benchmarks and save or compare
+    baselines. Returns the process exit status (1 if a regression was found).
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark the HashMap implementations.')
+    parser.add_argument('-n', type=int, default=5000,
+                        help='entries per workload (default 5000)')
+    parser.add_argument('--seed', type=int, default=261)
+    parser.add_argument('--impl', nargs='+', choices=IMPLEMENTATIONS,
+                        default=list(IMPLEMENTATIONS))
+    parser.add_argument('--workload', nargs='+', choices=WORKLOADS,
+                        default=list(WORKLOADS))
+    parser.add_argument('--save', metavar='FILE',
+                        help='write results as a JSON baseline')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='compare results against a JSON baseline')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='allowed relative slowdown (default 0.10)')
+    parser.add_argument('--probing', action='store_true',
+                        help='run the probe sequence sweep instead')
+    args = parser.parse_args()
+
+    if args.probing:
+        run_probing(args.n, args.seed)
+        return 0
+
+    print_header()
+    results = run_all(args.impl, args.workload, args.n, args.seed)
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({'n': args.n, 'seed': args.seed, 'results': results},
+                      file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if (baseline['n'], baseline['seed']) != (args.n, args.seed):
+            print("\nbaseline was recorded with different -n/--seed")
+            return 1
+        regressions = compare(results, baseline['results'], args.tolerance)
+        print()
+        for regression in regressions:
+            print("REGRESSION", regression)
+        if regressions:
+            return 1
+        print("no regressions")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,416 @@
+# Name: Stefan Law
+# Course: CS261 - Data Structures
+# Assignment: 6 - hash_map_cuckoo
+# Description: Python implementation of hash map utilizing bucketized
+# (4-way) cuckoo hashing with two tables and a small overflow stash. Every
+# key lives in one of two candidate buckets (or the stash), so get,
+# contains_key and remove inspect a bounded number of slots in the worst
+# case. Keys that collide under both hash functions share the same pair of
+# buckets, so the bound only holds for a hash pair that tells keys apart.
+# Built on top of an underlying Dynamic Array, alongside hash_map_sc and
+# hash_map_oa. Keys are hashed through key_hash.hash_key.
+
+from a6_include import (DynamicArray, HashEntry,
+                        hash_function_1, hash_function_2)
+from key_hash import hash_key
+
+
+class HashMap:
+    # Number of entries held by each bucket of a table
+    BUCKET_SIZE = 4
+
+    # Tables are doubled once this fraction of all entry slots is occupied
+    MAX_LOAD = 0.75
+
+    # Maximum number of entries held in the overflow stash before the
+    # tables are grown
+    STASH_LIMIT = 4
+
+    # Below this load factor a full stash is not grown any further: the
+    # stashed keys collide under both hash functions, so more slots won't help
+    MIN_GROW_LOAD = 0.125
+
+    def __init__(self,
+                 capacity: int = 11,
+                 function: callable = hash_function_1,
+                 function_2: callable = hash_function_2) -> None:
+        """
+        Initialize new HashMap that uses bucketized cuckoo hashing
+        for collision resolution
+        """
+        self._tables = (DynamicArray(), DynamicArray())
+
+        # capacity (buckets per table) must be a prime number
+        self._capacity = self._next_prime(capacity)
+        for table in self._tables:
+            for _ in range(self._capacity * self.BUCKET_SIZE):
+                table.append(None)
+
+        self._stash = DynamicArray()
+        self._hash_functions = (function, function_2)
+        self._size = 0
+        self._kick = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for t, table in enumerate(self._tables):
+            for i in range(self._capacity):
+                bucket = [str(table[i * self.BUCKET_SIZE + s])
+                          for s in range(self.BUCKET_SIZE)]
+                out += str(t) + '.' + str(i) + ': ' + ', '.join(bucket) + '\n'
+        out += 'stash: ' + str(self._stash) + '\n'
+        return out
+
+    def _next_prime(self, capacity: int) -> int:
+        """
+        Increment from given number to find the closest prime number
+        """
+        if capacity % 2 == 0:
+            capacity += 1
+
+        while not self._is_prime(capacity):
+            capacity += 2
+
+        return capacity
+
+    @staticmethod
+    def _is_prime(capacity: int) -> bool:
+        """
+        Determine if given integer is a prime number and return boolean
+        """
+        if capacity == 2 or capacity == 3:
+            return True
+
+        if capacity == 1 or capacity % 2 == 0:
+            return False
+
+        factor = 3
+        while factor ** 2 <= capacity:
+            if capacity % factor == 0:
+                return False
+            factor += 2
+
+        return True
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map (number of buckets in each of the two tables)
+        """
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _buckets_of(self, key: str) -> tuple[int, int]:
+        """
+        Return the indices of key's candidate buckets in the two tables. Each
+        index mixes both hash values, since either sample hash function alone
+        maps many keys (e.g. anagrams) to the same value and cuckoo hashing
+        needs the pair of buckets to differ between such keys.
+        """
+        hash_1 = hash_key(key, self._hash_functions[0])
+        hash_2 = hash_key(key, self._hash_functions[1])
+        return ((hash_1 ^ (hash_2 * 0x9E3779B1)) % self._capacity,
+                (hash_2 ^ (hash_1 * 0x85EBCA77)) % self._capacity)
+
+    def _locate(self, key: str) -> tuple[int, int]:
+        """
+        Return (table, slot) of the entry holding key in the two tables,
+        or None if the key is not stored there. Inspects at most
+        2 * BUCKET_SIZE slots.
+        """
+        buckets = self._buckets_of(key)
+        for table in range(2):
+            slot = buckets[table] * self.BUCKET_SIZE
+            for _ in range(self.BUCKET_SIZE):
+                entry = self._tables[table][slot]
+                if entry and entry.key == key:
+                    return table, slot
+                slot += 1
+
+        return None
+
+    def _find(self, key: str) -> HashEntry:
+        """
+        Return the HashEntry holding key, or None. Inspects the two candidate
+        buckets and the (bounded) stash.
+        """
+        location = self._locate(key)
+        if location:
+            return self._tables[location[0]][location[1]]
+
+        index = 0
+        while index != self._stash.length():
+            if self._stash[index].key == key:
+                return self._stash[index]
+            index += 1
+
+        return None
+
+    def _place(self, entry: HashEntry) -> HashEntry:
+        """
+        Insert entry into a free slot of one of its two buckets, evicting an
+        occupant to its alternate bucket when both are full. Gives up after a
+        bounded number of displacements and returns the entry left homeless
+        (None if placement succeeded).
+        """
+        max_kicks = 8 + 2 * self._capacity.bit_length()
+        for _ in range(max_kicks):
+            buckets = self._buckets_of(entry.key)
+            for table in range(2):
+                slot = buckets[table] * self.BUCKET_SIZE
+                for _ in range(self.BUCKET_SIZE):
+                    if self._tables[table][slot] is None:
+                        self._tables[table][slot] = entry
+                        return None
+                    slot += 1
+
+            # Both buckets are full: rotate through victims so that repeated
+            # displacements don't ping-pong between the same two entries
+            table = self._kick % 2
+            slot = (buckets[table] * self.BUCKET_SIZE
+                    + (self._kick // 2) % self.BUCKET_SIZE)
+            self._kick += 1
+            entry, self._tables[table][slot] = self._tables[table][slot], entry
+
+        return entry
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Add key/value pair to HashMap. If the key already exists, update its
+        associated value. Otherwise place the key in one of its two candidate
+        buckets, displacing occupants as needed. If the load factor is
+        >= MAX_LOAD, or the displacement chain fails and the stash is full,
+        the tables are doubled and rehashed. O(1) amortized runtime complexity.
+
+        :param: key (string)
+        :param: value (object of any type)
+        :return: None
+        """
+        entry = self._find(key)
+        if entry:
+            entry.value = value
+            return
+
+        if self.table_load() >= self.MAX_LOAD:
+            self.resize_table(2 * self._capacity)
+
+        homeless = self._place(HashEntry(key, value))
+        self._size += 1
+        if homeless:
+            self._stash.append(homeless)
+            if (self._stash.length() > self.STASH_LIMIT
+                    and self.table_load() > self.MIN_GROW_LOAD):
+                self.resize_table(2 * self._capacity)
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resize each table to new_capacity buckets. If new_capacity is not
+        prime, round to next prime number. If the new capacity cannot hold
+        the current contents below MAX_LOAD, it is doubled until it can.
+        Contents of the old tables and stash are rehashed.
+
+        :param: new_capacity (integer)
+        :return: None
+        """
+        if new_capacity < 1:
+            return
+
+        if not self._is_prime(new_capacity):
+            new_capacity = self._next_prime(new_capacity)
+
+        while self._size >= self.MAX_LOAD * 2 * self.BUCKET_SIZE * new_capacity:
+            new_capacity = self._next_prime(new_capacity * 2)
+
+        map_dump = self.get_keys_and_values()
+
+        self._capacity = new_capacity
+        self._tables = (DynamicArray(), DynamicArray())
+        for table in self._tables:
+            for _ in range(new_capacity * self.BUCKET_SIZE):
+                table.append(None)
+        self._stash = DynamicArray()
+
+        # Rehash without re-triggering growth; entries that cannot be placed
+        # go to the stash, which may exceed STASH_LIMIT when several keys
+        # collide under both hash functions
+        index = 0
+        while index != map_dump.length():
+            key, value = map_dump[index]
+            homeless = self._place(HashEntry(key, value))
+            if homeless:
+                self._stash.append(homeless)
+            index += 1
+
+    def table_load(self) -> float:
+        """
+        Calculates and returns the current load factor
+        (# of elements / entry slots across both tables).
+        O(1) runtime complexity.
+
+        :param: None
+        :return: load_factor (float)
+        """
+        return self._size / (2 * self.BUCKET_SIZE * self._capacity)
+
+    def empty_buckets(self) -> int:
+        """
+        Calculate number of empty entry slots across both tables.
+
+        :param: None
+        :return: int (number of empty buckets)
+        """
+        stored = self._size - self._stash.length()
+        return 2 * self.BUCKET_SIZE * self._capacity - stored
+
+    def get(self, key: str) -> object:
+        """
+        Look up key in its two candidate buckets and the stash. Return the
+        associated value if found, otherwise None. O(1) worst-case.
+
+        :param: key (string)
+        :return: value (object of any type) if key is found, otherwise None
+        """
+        entry = self._find(key)
+        if entry:
+            return entry.value
+        return None
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Return True if key is in the HashMap, otherwise False.
+        O(1) worst-case.
+
+        :param: key (string)
+        :return: bool
+        """
+        return self._find(key) is not None
+
+    def remove(self, key: str) -> None:
+        """
+        Remove key and its value from the HashMap. Slots are cleared directly,
+        since cuckoo hashing needs no tombstones. If no match is found,
+        nothing happens.
+
+        :param: key (string)
+        :return: None
+        """
+        location = self._locate(key)
+        if location:
+            self._tables[location[0]][location[1]] = None
+            self._size -= 1
+            return
+
+        index = 0
+        while index != self._stash.length():
+            if self._stash[index].key == key:
+                # Swap the match to the end of the stash and drop it
+                self._stash.swap(index, self._stash.length() - 1)
+                self._stash.pop()
+                self._size -= 1
+                return
+            index += 1
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray containing tuples of key/value pairs from
+        the HashMap.
+
+        :param: None
+        :return: DynamicArray object
+        """
+        output_arr = DynamicArray()
+        for table in self._tables:
+            index = 0
+            while index != table.length():
+                if table[index]:
+                    output_arr.append((table[index].key, table[index].value))
+                index += 1
+
+        index = 0
+        while index != self._stash.length():
+            output_arr.append((self._stash[index].key, self._stash[index].value))
+            index += 1
+
+        return output_arr
+
+    def clear(self) -> None:
+        """
+        Removes all stored key/value pairs without altering the capacity.
+
+        :param: None
+        :return: None
+        """
+        self._size = 0
+        for table in self._tables:
+            index = 0
+            while index != table.length():
+                table[index] = None
+                index += 1
+        self._stash = DynamicArray()
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\nput / get example")
+    print("-----------------")
+    m = HashMap(53, hash_function_1)
+    for i in range(150):
+        m.put('str' + str(i), i * 100)
+        if i % 25 == 24:
+            print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+    result = True
+    for i in range(150):
+        result &= m.get('str' + str(i)) == i * 100
+        result &= not m.contains_key('str' + str(i + 150))
+    print(result)
+
+    print("\nanagram keys (colliding under hash_function_1)")
+    print("----------------------------------------------")
+    m = HashMap(11)
+    for key in ('abc', 'acb', 'bac', 'bca', 'cab', 'cba'):
+        m.put(key, key.upper())
+    print(m.get_size(), m.get_capacity(), m.get('bca'), m.contains_key('aab'))
+
+    print("\nremove / clear example")
+    print("----------------------")
+    m = HashMap(11)
+    for i in range(20):
+        m.put('key' + str(i), i)
+    for i in range(0, 20, 2):
+        m.remove('key' + str(i))
+    m.remove('missing')
+    print(m.get_size(), m.get('key2'), m.get('key3'))
+    m.clear()
+    print(m.get_size(), m.get_capacity(), m.empty_buckets())
+
+    print("\nresize example")
+    print("--------------")
+    m = HashMap(75, hash_function_2)
+    keys = [i for i in range(1, 1000, 13)]
+    for key in keys:
+        m.put(str(key), key * 42)
+    for capacity in range(111, 1000, 117):
+        m.resize_table(capacity)
+        result = True
+        for key in keys:
+            result &= m.contains_key(str(key))
+            result &= not m.contains_key(str(key + 1))
+        print(capacity, result, m.get_size(), m.get_capacity(), round(m.table_load(), 2))
+
+    print("\nget_keys_and_values example")
+    print("---------------------------")
+    m = HashMap(11, hash_function_2)
+    for i in range(1, 6):
+        m.put(str(i), str(i * 10))
+    print(m.get_keys_and_values())
@@ -5,9 +5,14 @@
 # Description: Python implementation of hash map utilizing open addressing
 # with quadratic programming, along with related helper functions. Built on
 # top of an underlying Dynamic Array. Portfolio project for CS261- Data Structures
+# Keys are hashed through key_hash.hash_key.
+
+from array import array
 
 from a6_include import (DynamicArray, DynamicArrayException, HashEntry,
                         hash_function_1, hash_function_2)
+from key_hash import hash_key
+from typed_dynamic_array import TypedDynamicArray
 
 
 class HashMap:
@@ -86,11 +91,54 @@ class HashMap:
 
     # ------------------------------------------------------------------ #
 
+    # Probe sequence used by every lookup: 'linear', 'quadratic' (i + j**2,
+    # the default) or 'double' (double hashing with hash_function_2)
+    PROBING = ('linear', 'quadratic', 'double')
+    _probing = 'quadratic'
+
+    def set_probing(self, probing: str) -> None:
+        """
+        Select the probe sequence and rehash the current contents with it.
+        Quadratic probing on a prime capacity at load factor < 0.5 always
+        finds a free slot; linear and double hashing visit every slot.
+
+        :param: probing (string, one of PROBING)
+        :return: None
+        """
+        if probing not in self.PROBING:
+            raise ValueError('probing must be one of ' + ', '.join(self.PROBING))
+        self._probing = probing
+        self.resize_table(self._capacity)
+
+    def get_probing(self) -> str:
+        """
+        Return the name of the current probe sequence.
+        """
+        return self._probing
+
+    def _probe_start(self, key: str) -> tuple[int, int, int]:
+        """
+        Return (index, step, increment) describing key's probe sequence:
+        after visiting index, the next slot is (index + step) % capacity and
+        step grows by increment. Quadratic probing keeps the i + j**2
+        sequence but builds it from odd steps (j**2 - (j-1)**2 = 2j - 1),
+        so no probe pays for an exponentiation.
+
+        :param: key (string)
+        :return: tuple (int, int, int)
+        """
+        index = hash_key(key, self._hash_function) % self._capacity
+        if self._probing == 'quadratic':
+            return index, 1, 2
+        if self._probing == 'linear':
+            return index, 1, 0
+        return index, 1 + hash_key(key, hash_function_2) % (self._capacity - 1), 0
+
     def put(self, key: str, value: object) -> None:
         """
         Add key/value pair to HashMap. If load factor >= 0.5,
         first double the capacity of the HashMap and rehash it.
-        Use quadratic probe/addressing to determine placement of
+        Use the selected probe sequence to determine placement of
         key/value pair and store it in a HashEntry object. If the
         key already exists in the HashMap, update it's associated
         value.
@@ -103,20 +151,17 @@ class HashMap:
         if self.table_load() >= 0.5:
             self.resize_table(2 * self.get_capacity())
 
-        # Get hash
-        hash = self._hash_function(key)
-        index = hash % self.get_capacity()
+        # Get hash and probe sequence
+        index, step, increment = self._probe_start(key)
 
-        # Quadratic probe for next empty slot or _TS_ based on hash
-        j = 1
-        i = index
+        # Probe for next empty slot or _TS_ based on hash
         while self._buckets[index] and not self._buckets[index].is_tombstone:
             # If key is already in map, update value
             if self._buckets[index].key == key:
                 self._buckets[index].value = value
                 return
-            index = (i + (j ** 2)) % self.get_capacity()
-            j += 1
+            index = (index + step) % self.get_capacity()
+            step += increment
 
         # Otherwise, add new HashEntry at index
         self._buckets[index] = HashEntry(key, value)
@@ -182,52 +227,46 @@ class HashMap:
 
     def get(self, key: str) -> object:
         """
-        Search for key in HashMap using quadratic probing. If the
+        Search for key in HashMap using the selected probe sequence. If the
         key is found return value/object associated with it,
         otherwise return None.
 
         :param: key (string)
         :return: value(object of any type) if key is found, otherwise None
         """
-        # Determine hash
-        hash = self._hash_function(key)
-        index = hash % self.get_capacity()
+        # Determine hash and probe sequence
+        index, step, increment = self._probe_start(key)
 
-        # Probe quadratically until the key is found, or return None
-        j = 1
-        i = index
+        # Probe until the key is found, or return None
         while self._buckets[index]:
             # If key is already in map, return value
             if self._buckets[index].key == key:
                 if self._buckets[index].is_tombstone:
                     return None
                 return self._buckets[index].value
-            index = (i + (j ** 2)) % self.get_capacity()
-            j += 1
+            index = (index + step) % self.get_capacity()
+            step += increment
 
     def contains_key(self, key: str) -> bool:
         """
-        Search for key in HashMap using quadratic probing. If the
+        Search for key in HashMap using the selected probe sequence. If the
         key is found return True, otherwise return False.
 
         :param: key (string)
         :return: bool
         """
-        # Determine hash
-        hash = self._hash_function(key)
-        index = hash % self.get_capacity()
+        # Determine hash and probe sequence
+        index, step, increment = self._probe_start(key)
 
-        # Probe quadratically until the key is found, or return False
-        j = 1
-        i = index
+        # Probe until the key is found, or return False
         while self._buckets[index]:
             # If key is already in map, return value
             if self._buckets[index].key == key:
                 if self._buckets[index].is_tombstone:
                     return False
                 return True
-            index = (i + (j ** 2)) % self.get_capacity()
-            j += 1
+            index = (index + step) % self.get_capacity()
+            step += increment
 
         return False
 
@@ -239,13 +278,10 @@ class HashMap:
         :param: key (string)
         :return: None
         """
-        # Determine hash
-        hash = self._hash_function(key)
-        index = hash % self.get_capacity()
+        # Determine hash and probe sequence
+        index, step, increment = self._probe_start(key)
 
-        # Probe quadratically until the key is found, or return False
-        j = 1
-        i = index
+        # Probe until the key is found, or return False
         while self._buckets[index]:
             # If key is in map, tombstone it
             if self._buckets[index].key == key:
@@ -254,8 +290,8 @@ class HashMap:
                 self._buckets[index].is_tombstone = True
                 self._size -= 1
                 return
-            index = (i + (j ** 2)) % self.get_capacity()
-            j += 1
+            index = (index + step) % self.get_capacity()
+            step += increment
 
     def get_keys_and_values(self) -> DynamicArray:
         """
@@ -265,12 +301,11 @@ class HashMap:
         :param: None
         :return: DynamicArray object
         """
-        output_arr = DynamicArray()
-        index = 0
-        while index != self.get_capacity():
-            if self._buckets[index] and not self._buckets[index].is_tombstone:
-                output_arr.append((self._buckets[index].key, self._buckets[index].value))
-            index += 1
+        output_arr = TypedDynamicArray()
+        output_arr.extend((entry.key, entry.value)
+                          for entry in (self._buckets[index]
+                                        for index in range(self._capacity))
+                          if entry and not entry.is_tombstone)
 
         return output_arr
 
@@ -325,6 +360,230 @@ class HashMap:
         return value
 
 
+class OrderedHashMap(HashMap):
+    """
+    Insertion-ordered mode of the open addressing HashMap, laid out like
+    CPython's compact dict: a dense DynamicArray of HashEntry objects in
+    insertion order, plus a sparse index table (probed with the selected
+    sequence) that stores only small integers (positions in the dense
+    array). Iteration and get_keys_and_values scan the dense array, so their
+    order is insertion order and is unaffected by resize_table.
+    """
+
+    # Sentinels stored in the sparse index table
+    EMPTY = -1
+    DUMMY = -2
+
+    def __init__(self, capacity: int, function) -> None:
+        """
+        Initialize new insertion-ordered HashMap that uses
+        quadratic probing for collision resolution
+        """
+        self._capacity = self._next_prime(capacity)
+        self._indices = self._new_indices(self._capacity)
+        self._entries = DynamicArray()
+        self._hash_function = function
+        self._size = 0
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._capacity):
+            position = self._indices[i]
+            entry = self._entries[position] if position >= 0 else None
+            out += str(i) + ': ' + str(entry) + '\n'
+        return out
+
+    @staticmethod
+    def _new_indices(capacity: int) -> array:
+        """
+        Return a sparse index table of the given capacity, filled with EMPTY,
+        using the narrowest signed typecode that can address capacity
+        entries (the dense array never holds more than capacity / 2 + 1).
+        """
+        for typecode in ('b', 'h', 'i', 'q'):
+            if capacity < 2 ** (8 * array(typecode).itemsize - 1):
+                break
+        return array(typecode, [OrderedHashMap.EMPTY]) * capacity
+
+    def _probe(self, key: str) -> tuple[int, int]:
+        """
+        Probe the index table for key. Return (slot, position) where position
+        is the key's place in the dense array (or EMPTY if absent) and slot
+        is the index slot holding it, or the first reusable slot if absent.
+        """
+        index, step, increment = self._probe_start(key)
+        free = None
+
+        while True:
+            position = self._indices[index]
+            if position == self.EMPTY:
+                return (index if free is None else free), self.EMPTY
+            if position == self.DUMMY:
+                if free is None:
+                    free = index
+            elif self._entries[position].key == key:
+                return index, position
+            index = (index + step) % self._capacity
+            step += increment
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Add key/value pair to HashMap, appending it to the dense array so
+        that insertion order is kept. If the key already exists, update its
+        value in place (its position in the order is unchanged). Resize
+        first if the new entry would make the dense array (live and removed
+        entries, one index slot each) fill more than (capacity - 1) / 2
+        slots, beyond which quadratic probing on a prime capacity may miss
+        every EMPTY slot; when most of those are removed entries, the dense
+        array is compacted at the current capacity instead of doubling.
+
+        :param: key (string)
+        :param: value (object of any type)
+        :return: None
+        """
+        if 2 * (self._entries.length() + 1) > self._capacity:
+            if self._size >= self._capacity / 4:
+                self.resize_table(2 * self._capacity)
+            else:
+                self.resize_table(self._capacity)
+
+        slot, position = self._probe(key)
+        if position != self.EMPTY:
+            self._entries[position].value = value
+            return
+
+        self._indices[slot] = self._entries.length()
+        self._entries.append(HashEntry(key, value))
+        self._size += 1
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resize the index table to new_capacity (rounded to the next prime,
+        and doubled until the live entries fill less than half of it) and
+        compact the dense array, dropping removed entries while keeping
+        the insertion order of the remaining ones.
+
+        :param: new_capacity(integer)
+        :return: None
+        """
+        if new_capacity < self._size:
+            return
+
+        if not self._is_prime(new_capacity):
+            new_capacity = self._next_prime(new_capacity)
+
+        # Keep at most (capacity - 1) / 2 slots in use: quadratic probing on
+        # a prime capacity reaches (capacity + 1) / 2 distinct slots, so it
+        # always finds an EMPTY one
+        while 2 * self._size >= new_capacity:
+            new_capacity = self._next_prime(2 * new_capacity)
+
+        old_entries = self._entries
+        self._entries = DynamicArray()
+        self._capacity = new_capacity
+        self._indices = self._new_indices(new_capacity)
+
+        index = 0
+        while index != old_entries.length():
+            entry = old_entries[index]
+            if entry:
+                slot = self._probe(entry.key)[0]
+                self._indices[slot] = self._entries.length()
+                self._entries.append(entry)
+            index += 1
+
+    def empty_buckets(self) -> int:
+        """
+        Calculate number of empty buckets
+
+        :param: none
+        :return: int (number of empty buckets)
+        """
+        return self._capacity - self._size
+
+    def get(self, key: str) -> object:
+        """
+        Return value associated with key, or None if key is not in the map.
+
+        :param: key (string)
+        :return: value(object of any type) if key is found, otherwise None
+        """
+        position = self._probe(key)[1]
+        if position == self.EMPTY:
+            return None
+        return self._entries[position].value
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Return True if key is in the HashMap, otherwise False.
+
+        :param: key (string)
+        :return: bool
+        """
+        return self._probe(key)[1] != self.EMPTY
+
+    def remove(self, key: str) -> None:
+        """
+        Remove key from HashMap by marking its index slot DUMMY and clearing
+        its dense array entry. The hole is compacted away on the next
+        resize_table. If no match is found, nothing happens.
+
+        :param: key (string)
+        :return: None
+        """
+        slot, position = self._probe(key)
+        if position == self.EMPTY:
+            return
+        self._indices[slot] = self.DUMMY
+        self._entries[position] = None
+        self._size -= 1
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray containing tuples of key/value pairs from
+        the HashMap, in insertion order.
+
+        :param: None
+        :return: DynamicArray object
+        """
+        output_arr = TypedDynamicArray()
+        output_arr.extend((entry.key, entry.value)
+                          for entry in (self._entries[index]
+                                        for index in range(self._entries.length()))
+                          if entry)
+
+        return output_arr
+
+    def clear(self) -> None:
+        """
+        Clears the HashMap, keeping the current capacity.
+
+        :param: None
+        :return: None
+        """
+        self._size = 0
+        self._entries = DynamicArray()
+        self._indices = self._new_indices(self._capacity)
+
+    def __next__(self):
+        """
+        Iterates to next live HashEntry, in insertion order.
+
+        :param: none
+        :return: value (HashEntry object)
+        """
+        while self._index < self._entries.length():
+            entry = self._entries[self._index]
+            self._index += 1
+            if entry:
+                return entry
+
+        raise StopIteration
+
+
 # ------------------- BASIC TESTING ---------------------------------------- #
 
 if __name__ == "__main__":
@@ -543,3 +802,52 @@ if __name__ == "__main__":
     print(m)
     for item in m:
         print('K:', item.key, 'V:', item.value)
+
+    print("\nOrderedHashMap - insertion order across resizes")
+    print("---------------------")
+    m = OrderedHashMap(5, hash_function_2)
+    for i in range(10, 0, -1):
+        m.put(str(i), i * 10)
+    m.remove('7')
+    m.put('3', 'thirty')
+    m.put('7', 70)
+    print(m.get_size(), m.get_capacity(), m.get('3'), m.contains_key('11'))
+    print(m.get_keys_and_values())
+    m.resize_table(100)
+    print(m.get_keys_and_values())
+    print([item.key for item in m])
+
+    # Regression: 'a', 'b' and 'e' used to fill all 3 slots that a missing
+    # key probes on capacity 5, so contains_key('f') never returned
+    m = OrderedHashMap(5, hash_function_1)
+    for key in ('a', 'b', 'e'):
+        m.put(key, key)
+    print(m.contains_key('f'), m.get('e'), m.get_capacity())
+
+    print("\nprobing strategies")
+    print("---------------------")
+    for probing in HashMap.PROBING:
+        m = HashMap(11, hash_function_2)
+        m.put('key0', 0)
+        m.set_probing(probing)
+        for i in range(1, 500):
+            m.put('key' + str(i), i)
+        for i in range(0, 500, 3):
+            m.remove('key' + str(i))
+        result = True
+        for i in range(500):
+            result &= m.get('key' + str(i)) == (None if i % 3 == 0 else i)
+            result &= m.contains_key('key' + str(i)) == (i % 3 != 0)
+        print(m.get_probing(), result, m.get_size(), m.get_capacity())
+
+    print("\nnon-string keys")
+    print("---------------")
+    m = HashMap(11, hash_function_1)
+    for i in range(1000):
+        m.put(i, i * i)
+    m.put((3, 'x'), 'tuple')
+    m.put(b'raw', 'bytes')
+    for i in range(0, 1000, 2):
+        m.remove(i)
+    print(m.get_size(), m.get(999), m.get(998), m.get((3, 'x')), m.get(b'raw'),
+          m.contains_key(3.0), m.contains_key((3, 'y')))
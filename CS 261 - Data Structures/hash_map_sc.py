@@ -5,10 +5,17 @@
 # Description: Python implementation of hash map utilizing separate
 # chaining, along with related helper functions. Built on top of an
 # underlying Dynamic Array. Portfolio project for CS261 - Data Structures
+# Keys are hashed through key_hash.hash_key.
 
 
-from a6_include import (DynamicArray, LinkedList,
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from a6_include import (DynamicArray, LinkedList, SLNode,
                         hash_function_1, hash_function_2)
+from key_hash import hash_key
+from typed_dynamic_array import TypedDynamicArray
 
 
 class HashMap:
@@ -108,7 +115,7 @@ class HashMap:
             self.resize_table(2 * self._capacity)
 
         # Get key hash and associated LinkedList
-        hash = self._hash_function(key)
+        hash = hash_key(key, self._hash_function)
         index = hash % self._capacity
         list_at_hash = self._buckets[index]
 
@@ -165,8 +172,7 @@ class HashMap:
 
         # Re-hash and transfer all items in current HashMap
         self.clear()
-        while map_dump.length() != 0:
-            key, value = map_dump.pop()
+        for key, value in reversed(map_dump):
             self.put(key, value)
 
     def table_load(self) -> float:
@@ -213,7 +219,7 @@ class HashMap:
         :returns: associated value(object of any type) if matching key is found, otherwise None
         """
         # Determine hash
-        hash = self._hash_function(key)
+        hash = hash_key(key, self._hash_function)
         index = hash % self._capacity
 
         # Iterate thru list at index to look for key and return value associated with key
@@ -233,7 +239,7 @@ class HashMap:
         :return: Boolean (True if key is found, otherwise False)
         """
         # Determine hash
-        hash = self._hash_function(key)
+        hash = hash_key(key, self._hash_function)
         index = hash % self._capacity
 
         # Iterate thru list at index to look for key and return True if found
@@ -252,7 +258,7 @@ class HashMap:
         :return: None
         """
         # Determine hash
-        hash = self._hash_function(key)
+        hash = hash_key(key, self._hash_function)
         index = hash % self._capacity
 
         # look for key and remove if found
@@ -268,17 +274,13 @@ class HashMap:
         :param: None
         :return: output_array (DynamicArray)
         """
-        # Create output array
-        output_array = DynamicArray()
-
-        # iterate through linked lists in HashMap
-        index = 0
-        while index != self._buckets.length():
-            linked_list = self._buckets[index]
-            # iterate through linked list and insert key:value pair into output array as a tuple
-            for item in linked_list:
-                output_array.append((item.key, item.value))
-            index += 1
+        # Create output array and fill it in one bulk extend, iterating
+        # through each linked list in the HashMap and yielding key:value
+        # pairs as tuples
+        output_array = TypedDynamicArray()
+        output_array.extend((item.key, item.value)
+                            for index in range(self._buckets.length())
+                            for item in self._buckets[index])
 
         return output_array
 
@@ -300,49 +302,363 @@ class HashMap:
         self._size = 0
 
 
+class NodePool:
+    """
+    Free list of recycled SLNode objects, threaded through their next
+    pointers and capped at max_size nodes. Nodes beyond the cap are left to
+    the garbage collector.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """Initialize an empty pool holding at most max_size nodes."""
+        self._free = None
+        self._size = 0
+        self._max_size = max_size
+
+    def get_size(self) -> int:
+        """Return number of nodes currently held by the pool."""
+        return self._size
+
+    def acquire(self, key: str, value: object, next: SLNode = None) -> SLNode:
+        """Return a recycled node (or a new one) holding key and value."""
+        node = self._free
+        if node is None:
+            return SLNode(key, value, next)
+
+        self._free = node.next
+        self._size -= 1
+        node.key, node.value, node.next = key, value, next
+        return node
+
+    def release(self, node: SLNode) -> None:
+        """Return node to the pool, dropping its key and value references."""
+        if self._size < self._max_size:
+            node.key = node.value = None
+            node.next = self._free
+            self._free = node
+            self._size += 1
+
+    def release_chain(self, node: SLNode) -> None:
+        """Return every node of a chain to the pool (up to the cap)."""
+        while node and self._size < self._max_size:
+            next_node = node.next
+            self.release(node)
+            node = next_node
+
+
+class PooledLinkedList(LinkedList):
+    """
+    LinkedList that takes its nodes from a NodePool and gives removed nodes
+    back to it.
+    """
+
+    def __init__(self, pool: NodePool) -> None:
+        """Initialize an empty list drawing nodes from pool."""
+        super().__init__()
+        self._pool = pool
+
+    def insert(self, key: str, value: object) -> None:
+        """Insert new node (taken from the pool) at front of the list."""
+        self._head = self._pool.acquire(key, value, self._head)
+        self._size += 1
+
+    def insert_node(self, node: SLNode) -> None:
+        """Link an existing node in at front of the list."""
+        node.next = self._head
+        self._head = node
+        self._size += 1
+
+    def remove(self, key: str) -> bool:
+        """
+        Remove first node with matching key and return it to the pool.
+        Return True if removal was successful, False otherwise.
+        """
+        previous, node = None, self._head
+        while node:
+
+            if node.key == key:
+                if previous:
+                    previous.next = node.next
+                else:
+                    self._head = node.next
+                self._size -= 1
+                self._pool.release(node)
+                return True
+
+            previous, node = node, node.next
+        return False
+
+    def detach(self) -> SLNode:
+        """Empty the list and return its former chain of nodes."""
+        head = self._head
+        self._head = None
+        self._size = 0
+        return head
+
+
+class PooledHashMap(HashMap):
+    """
+    Separate chaining HashMap that owns a NodePool: nodes dropped by remove
+    and clear are recycled by later puts, and resize_table relinks the
+    existing nodes into the new buckets instead of rebuilding the map, so
+    insert/delete churn allocates (almost) no new SLNodes.
+    """
+
+    def __init__(self,
+                 capacity: int = 11,
+                 function: callable = hash_function_1,
+                 pool_size: int = 1024) -> None:
+        """
+        Initialize new pooled HashMap; the pool keeps at most pool_size
+        free nodes.
+        """
+        super().__init__(capacity, function)
+        self._pool = NodePool(pool_size)
+        index = 0
+        while index != self._capacity:
+            self._buckets[index] = PooledLinkedList(self._pool)
+            index += 1
+
+    def get_pool(self) -> NodePool:
+        """Return the map's node pool."""
+        return self._pool
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Changes capacity of HashMap to new_capacity, rounded up to a prime
+        (and doubled until it is at least the map's size). Nodes are unlinked
+        from the old buckets and relinked into their new ones, without
+        allocating. If the passed capacity is < 1, the function returns.
+
+        :param: new_capacity (integer)
+        :return: None
+        """
+        if new_capacity < 1:
+            return
+
+        if not self._is_prime(new_capacity):
+            new_capacity = self._next_prime(new_capacity)
+
+        while new_capacity < self._size:
+            new_capacity = self._next_prime(new_capacity * 2)
+
+        # Detach every chain before the bucket array changes size
+        chains = []
+        index = 0
+        while index != self._capacity:
+            head = self._buckets[index].detach()
+            if head:
+                chains.append(head)
+            index += 1
+
+        while self._buckets.length() < new_capacity:
+            self._buckets.append(PooledLinkedList(self._pool))
+        while self._buckets.length() > new_capacity:
+            self._buckets.pop()
+        self._capacity = new_capacity
+
+        for node in chains:
+            while node:
+                next_node = node.next
+                index = hash_key(node.key, self._hash_function) % new_capacity
+                self._buckets[index].insert_node(node)
+                node = next_node
+
+    def clear(self) -> None:
+        """
+        Removes all stored key/value pairs, returning their nodes to the
+        pool, without altering the underlying capacity.
+
+        :param: None
+        :return: None
+        """
+        index = 0
+        while index != self._capacity:
+            self._pool.release_chain(self._buckets[index].detach())
+            index += 1
+
+        self._size = 0
+
+
+class CountingHashMap(HashMap):
+    """
+    Separate chaining HashMap whose values are counts. increment() finds or
+    creates the key's node with a single hash computation and chain walk,
+    instead of the contains_key / get / put sequence.
+    """
+
+    def increment(self, key: str, delta: int = 1) -> int:
+        """
+        Add delta to the count stored for key, starting from 0 if the key is
+        not in the map yet. Resizes like put when the load factor is >= 1.0.
+        O(1) average runtime complexity.
+
+        :param: key (string)
+        :param: delta (int, amount to add)
+        :return: the key's updated count (int)
+        """
+        if self.table_load() >= 1.0:
+            self.resize_table(2 * self._capacity)
+
+        list_at_hash = self._buckets[hash_key(key, self._hash_function) % self._capacity]
+        node = list_at_hash.contains(key)
+        if node:
+            node.value += delta
+            return node.value
+
+        list_at_hash.insert(key, delta)
+        self._size += 1
+        return delta
+
+    def count(self, key: str) -> int:
+        """
+        Return the count stored for key, or 0 if the key is not in the map.
+
+        :param: key (string)
+        :return: count (int)
+        """
+        count = self.get(key)
+        return count if count is not None else 0
+
+
+class MultiHashMap(HashMap):
+    """
+    Separate chaining HashMap mapping each key to a DynamicArray of values.
+    add() appends to the key's value array with a single hash computation
+    and chain walk; get() returns that array.
+    """
+
+    def add(self, key: str, value: object) -> int:
+        """
+        Append value to the values stored for key, creating the key's value
+        array if needed. Resizes like put when the load factor is >= 1.0.
+        O(1) average runtime complexity.
+
+        :param: key (string)
+        :param: value (object of any type)
+        :return: number of values now stored for key (int)
+        """
+        if self.table_load() >= 1.0:
+            self.resize_table(2 * self._capacity)
+
+        list_at_hash = self._buckets[hash_key(key, self._hash_function) % self._capacity]
+        node = list_at_hash.contains(key)
+        if node:
+            node.value.append(value)
+            return node.value.length()
+
+        list_at_hash.insert(key, DynamicArray([value]))
+        self._size += 1
+        return 1
+
+
+def _elements(source) -> iter:
+    """
+    Return an iterator over source, which may be any iterable or a
+    DynamicArray (whose iterator capability is disabled).
+    """
+    if isinstance(source, TypedDynamicArray):
+        return iter(source)
+    if isinstance(source, DynamicArray):
+        return (source[index] for index in range(source.length()))
+    return iter(source)
+
+
 def find_mode(da: DynamicArray) -> tuple[DynamicArray, int]:
     """
     Receives an unsorted DynamicArray and determines the mode and associated
     value(s), returning a tuple containing an array of the value(s)
-    and the mode. The array is first placed into a HashMap, with the values
-    of the array being stored as keys and their frequency being stored as values.
-    The key/value pairs of the map are then dumped using get_keys_and_values(),
-    and the resulting array is iterated over to determine the mode and associated
-    key(s), which are then placed in an output array and returned along with the mode.
-    O(N) runtime complexity.
+    and the mode. Each value is counted in a CountingHashMap with a single
+    increment() call, and the winning value(s) and frequency are tracked as
+    the counts change, so no second pass over the map is needed: a value
+    whose count rises above the current frequency starts a new output array,
+    and a value whose count reaches it is appended. O(N) runtime complexity.
 
     :param: da (DynamicArray)
     :returns: tuple (DynamicArray, int)
     """
-    map = HashMap(11, hash_function_2)
+    map = CountingHashMap(11, hash_function_2)
     output_arr = None
     freq = 0
 
-    index = 0
-    # Iterate through input array and create a HashMap for each potential key,
-    # and store a frequency count in the key's associated value
-    while index != da.length():
-        key = da[index]
-        if map.contains_key(key):
-            map.put(key, map.get(key) + 1)
-        else:
-            map.put(key, 1)
-        index += 1
-    # Iterate through map, testing each key to see if it's value is equal to
-    # or higher than current frequency. If higher, we need to clear the output
-    # array, update the frequency, and append the key to the output array. If
-    # equal, then we need to append the key to the output array.
-    map_dump = map.get_keys_and_values()
-    index = 0
-    while index < map_dump.length():
-        item = map_dump[index]
-        if item[1] > freq:
+    for key in _elements(da):
+        count = map.increment(key)
+        if count > freq:
             output_arr = DynamicArray()
-            freq = item[1]
-            output_arr.append(item[0])
-        elif item[1] == freq:
-            output_arr.append(item[0])
-        index += 1
+            freq = count
+            output_arr.append(key)
+        elif count == freq:
+            output_arr.append(key)
+
+    return output_arr, freq
+
+
+def _count_chunk(chunk: list) -> list:
+    """
+    Count the values of one chunk of input in a CountingHashMap and return
+    the partial counts as a list of (value, count) tuples. Runs in a worker
+    process for find_mode_stream.
+    """
+    counts = CountingHashMap(11, hash_function_2)
+    for key in chunk:
+        counts.increment(key)
+    pairs = counts.get_keys_and_values()
+    return [pairs[index] for index in range(pairs.length())]
+
+
+def find_mode_stream(source,
+                     chunk_size: int = 65536,
+                     workers: int = None) -> tuple[DynamicArray, int]:
+    """
+    Streaming counterpart of find_mode. Consumes any iterable (or a
+    DynamicArray) in chunks of chunk_size values, so the input never has to
+    be held in memory; only one count per distinct value is kept. The
+    winning value(s) and frequency are tracked as counts are merged, so no
+    final scan of the map is needed.
+
+    With workers > 1, chunks are counted in a process pool and the partial
+    counts merged in input order (at most 2 * workers chunks are in flight).
+    The result is the same as the sequential mode, except that the order of
+    tied values may differ. O(N) runtime complexity.
+
+    :param: source (iterable or DynamicArray)
+    :param: chunk_size (int, values per chunk)
+    :param: workers (int, number of worker processes; None or 1 = sequential)
+    :returns: tuple (DynamicArray, int)
+    """
+    counts = CountingHashMap(11, hash_function_2)
+    output_arr = None
+    freq = 0
+
+    def merge(key, delta: int) -> None:
+        nonlocal output_arr, freq
+        count = counts.increment(key, delta)
+        if count > freq:
+            output_arr = DynamicArray()
+            freq = count
+            output_arr.append(key)
+        elif count == freq:
+            output_arr.append(key)
+
+    elements = _elements(source)
+    chunks = iter(lambda: list(islice(elements, chunk_size)), [])
+
+    if not workers or workers <= 1:
+        for chunk in chunks:
+            for key in chunk:
+                merge(key, 1)
+        return output_arr, freq
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_count_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                for key, count in pending.popleft().result():
+                    merge(key, count)
+        while pending:
+            for key, count in pending.popleft().result():
+                merge(key, count)
 
     return output_arr, freq
 
@@ -603,3 +919,54 @@ if __name__ == "__main__":
         da = DynamicArray(case)
         mode, frequency = find_mode(da)
         print(f"Input: {da}\nMode : {mode}, Frequency: {frequency}\n")
+
+    print("\nfind_mode - non-string keys")
+    print("-----------------------------")
+    da = DynamicArray([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5])
+    mode, frequency = find_mode(da)
+    print(f"Input: {da}\nMode : {mode}, Frequency: {frequency}")
+    m = HashMap(11, hash_function_1)
+    for key in (1, 1.0, -7, 2 ** 80, b'bytes', ('x', 1), (1, 'x'), 'str'):
+        m.put(key, repr(key))
+    print(m.get_size(), m.get(1), m.get((1, 'x')), m.get(b'bytes'),
+          m.contains_key(2 ** 80), m.contains_key(('x', 2)))
+
+    print("\nCountingHashMap / MultiHashMap example")
+    print("-----------------------------")
+    counts = CountingHashMap(11, hash_function_2)
+    groups = MultiHashMap(11, hash_function_2)
+    for word in ["apple", "avocado", "banana", "apple", "blueberry", "apple"]:
+        counts.increment(word)
+        groups.add(word[0], word)
+    print(counts.count("apple"), counts.count("banana"), counts.count("cherry"))
+    print(counts.increment("banana", 5), groups.get("a"), groups.get("b"))
+
+    print("\nfind_mode_stream - sequential and parallel")
+    print("-----------------------------")
+    words = ("Arch", "Manjaro", "Mint", "Ubuntu", "Mint", "Ubuntu", "Mint")
+    for workers in (None, 4):
+        stream = (words[i % len(words)] + str(i % 5) for i in range(20000))
+        mode, frequency = find_mode_stream(stream, chunk_size=1000, workers=workers)
+        print(f"workers: {workers}, Mode : {mode}, Frequency: {frequency}")
+    da = DynamicArray(["2", "4", "2", "6", "8", "4", "1", "3", "4", "5", "7", "3", "3", "2"])
+    mode, frequency = find_mode_stream(da, chunk_size=4)
+    print(f"Input: {da}\nMode : {mode}, Frequency: {frequency}")
+
+    print("\nPooledHashMap - insert/delete churn")
+    print("-----------------------------")
+    m = PooledHashMap(11, hash_function_2, pool_size=64)
+    for i in range(200):
+        m.put('key' + str(i), i)
+    for i in range(0, 200, 2):
+        m.remove('key' + str(i))
+    print(m.get_size(), m.get_capacity(), m.get_pool().get_size())
+    for i in range(200, 250):
+        m.put('key' + str(i), i)
+    print(m.get_size(), m.get_pool().get_size(), m.get('key201'), m.get('key2'))
+    m.resize_table(500)
+    result = True
+    for i in range(1, 250, 2):
+        result &= m.get('key' + str(i)) == i
+    print(result, m.get_size(), m.get_capacity(), m.empty_buckets())
+    m.clear()
+    print(m.get_size(), m.get_capacity(), m.get_pool().get_size())
@@ -0,0 +1,327 @@
+# Name: Stefan Law
+# Course: CS261 - Data Structures
+# Description: Asyncio service layer over the HashMaps. Concurrent requests
+# are coalesced into micro-batches (collected for a short window, or until
+# a batch fills up) and each batch is applied to the map in one go. Before a
+# batch with inserts is applied, the map is grown if the inserts would push
+# it past its load limit; that resize_table call runs in an executor so the
+# event loop keeps serving while the table is rehashed. Includes a
+# newline-delimited JSON protocol over TCP or a Unix socket and a load-test
+# client.
+#
+# Run from this directory, e.g.:
+#   python hash_map_service.py                      (in-process demo)
+#   python hash_map_service.py serve --port 8765
+#   python hash_map_service.py loadtest --port 8765 --clients 100
+
+import argparse
+import asyncio
+import json
+import time
+from math import ceil
+
+import hash_map_oa
+from a6_include import hash_function_2
+
+
+class HashMapService:
+    """
+    Request-batching front end for a HashMap (any of the implementations).
+    Supported coroutines are: get, contains_key, put, remove
+    """
+
+    def __init__(self,
+                 map,
+                 window: float = 0.0005,
+                 max_batch: int = 1024,
+                 max_load: float = 0.5,
+                 executor=None) -> None:
+        """
+        Wrap map. Must be created while an event loop is running.
+
+        :param map: HashMap to serve; only this service may touch it
+        :param window: seconds to wait for more requests before a batch runs
+        :param max_batch: batch size that triggers an immediate run
+        :param max_load: load factor the map is grown below ahead of inserts
+                         (0.5 for open addressing, 1.0 for separate chaining)
+        :param executor: executor for resizes (the loop's default if None)
+        """
+        self._map = map
+        self._window = window
+        self._max_batch = max_batch
+        self._max_load = max_load
+        self._executor = executor
+        self._loop = asyncio.get_running_loop()
+        self._pending = []
+        self._timer = None
+        self._lock = asyncio.Lock()
+        self._batches = 0
+        self._resizes = 0
+
+    def get_stats(self) -> dict:
+        """Return counts of batches run and background resizes."""
+        return {'batches': self._batches, 'resizes': self._resizes}
+
+    def _submit(self, operation: str, key: str, value: object = None):
+        """Queue a request and return a future for its result."""
+        future = self._loop.create_future()
+        self._pending.append((operation, key, value, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = self._loop.call_later(self._window, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Hand the queued requests to a batch task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            self._loop.create_task(self._run_batch(batch))
+
+    async def _run_batch(self, batch: list) -> None:
+        """
+        Apply one batch to the map. Batches run one at a time; a needed
+        resize is awaited in the executor before the batch is applied. If
+        the batch fails outside a single request (e.g. the resize raises),
+        every unresolved future receives the error.
+        """
+        async with self._lock:
+            try:
+                await self._apply_batch(batch)
+            except Exception as error:
+                # Fail every request still waiting rather than leave its
+                # client awaiting a future that is never resolved
+                for request in batch:
+                    if not request[3].done():
+                        request[3].set_exception(error)
+            else:
+                self._batches += 1
+
+    async def _apply_batch(self, batch: list) -> None:
+        """
+        Resize the map in the executor if the batch's inserts need it, then
+        resolve each request's future with its result or error.
+        """
+        inserts = sum(1 for request in batch if request[0] == 'put')
+        expected = self._map.get_size() + inserts
+        if inserts and expected / self._map.get_capacity() >= self._max_load:
+            new_capacity = 2 * ceil(expected / self._max_load)
+            await self._loop.run_in_executor(
+                self._executor, self._map.resize_table, new_capacity)
+            self._resizes += 1
+
+        for operation, key, value, future in batch:
+            if future.cancelled():
+                continue
+            try:
+                if operation == 'get':
+                    result = self._map.get(key)
+                elif operation == 'contains_key':
+                    result = self._map.contains_key(key)
+                elif operation == 'put':
+                    result = self._map.put(key, value)
+                else:
+                    result = self._map.remove(key)
+            except Exception as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    async def get(self, key: str) -> object:
+        """Return value associated with key, or None."""
+        return await self._submit('get', key)
+
+    async def contains_key(self, key: str) -> bool:
+        """Return True if key is in the map, otherwise False."""
+        return await self._submit('contains_key', key)
+
+    async def put(self, key: str, value: object) -> None:
+        """Add key/value pair, or update key's value if present."""
+        await self._submit('put', key, value)
+
+    async def remove(self, key: str) -> None:
+        """Remove key from the map if present."""
+        await self._submit('remove', key)
+
+
+# ------------------------- PROTOCOL --------------------------------------- #
+#
+# One JSON object per line. Requests: {"id": 7, "op": "get", "key": "k"}
+# ("value" is also sent for "put"). Responses: {"id": 7, "result": ...} or
+# {"id": 7, "error": "..."}. Requests on one connection may be pipelined;
+# responses carry the request id and may arrive out of order.
+
+OPERATIONS = ('get', 'contains_key', 'put', 'remove')
+
+
+async def _handle_request(service: HashMapService, line: bytes,
+                          writer: asyncio.StreamWriter) -> None:
+    """Serve one request line and write its response."""
+    request_id = None
+    try:
+        request = json.loads(line)
+        request_id = request.get('id')
+        operation = request['op']
+        if operation not in OPERATIONS:
+            raise ValueError('unknown op ' + repr(operation))
+        if operation == 'put':
+            result = await service.put(request['key'], request.get('value'))
+        else:
+            result = await getattr(service, operation)(request['key'])
+        response = {'id': request_id, 'result': result}
+    except Exception as error:
+        response = {'id': request_id, 'error': str(error)}
+    writer.write(json.dumps(response).encode() + b'\n')
+
+
+async def _handle_connection(service: HashMapService,
+                             reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+    """Serve pipelined requests from one client until it disconnects."""
+    tasks = set()
+    try:
+        while line := await reader.readline():
+            task = asyncio.create_task(_handle_request(service, line, writer))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def start_server(service: HashMapService,
+                       host: str = '127.0.0.1',
+                       port: int = 8765,
+                       path: str = None) -> asyncio.AbstractServer:
+    """
+    Start serving the protocol on a TCP port, or on a Unix socket if path is
+    given, and return the server.
+    """
+    def handler(reader, writer):
+        return _handle_connection(service, reader, writer)
+
+    if path:
+        return await asyncio.start_unix_server(handler, path)
+    return await asyncio.start_server(handler, host, port)
+
+
+# ------------------------- LOAD TEST -------------------------------------- #
+
+async def _open(host: str, port: int, path: str):
+    """Open a client connection over TCP or a Unix socket."""
+    if path:
+        return await asyncio.open_unix_connection(path)
+    return await asyncio.open_connection(host, port)
+
+
+async def _client(host: str, port: int, path: str, requests: int,
+                  key_space: int, write_ratio: float, in_flight: int,
+                  seed: int, latencies: list) -> None:
+    """Run one load-test client, pipelining up to in_flight requests."""
+    import random
+    rng = random.Random(seed)
+    reader, writer = await _open(host, port, path)
+    sent_at = {}
+    window = asyncio.Semaphore(in_flight)
+
+    async def receive() -> None:
+        for _ in range(requests):
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent_at.pop(response['id']))
+            window.release()
+
+    receiver = asyncio.create_task(receive())
+    for request_id in range(requests):
+        await window.acquire()
+        key = 'key' + str(rng.randrange(key_space))
+        if rng.random() < write_ratio:
+            request = {'id': request_id, 'op': 'put', 'key': key, 'value': request_id}
+        else:
+            request = {'id': request_id, 'op': 'get', 'key': key}
+        sent_at[request_id] = time.perf_counter()
+        writer.write(json.dumps(request).encode() + b'\n')
+        await writer.drain()
+    await receiver
+    writer.close()
+    await writer.wait_closed()
+
+
+async def load_test(host: str = '127.0.0.1',
+                    port: int = 8765,
+                    path: str = None,
+                    clients: int = 50,
+                    requests: int = 1000,
+                    key_space: int = 10000,
+                    write_ratio: float = 0.2,
+                    in_flight: int = 16) -> dict:
+    """
+    Drive a running server with concurrent clients and return throughput
+    and latency percentiles.
+    """
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, path, requests, key_space, write_ratio,
+                in_flight, seed, latencies)
+        for seed in range(clients)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'requests_per_sec': len(latencies) / elapsed,
+        'p50_ms': latencies[len(latencies) // 2] * 1000,
+        'p99_ms': latencies[int(len(latencies) * 0.99)] * 1000,
+    }
+
+
+async def _serve_forever(args) -> None:
+    """Run a server over a fresh open addressing map until interrupted."""
+    service = HashMapService(hash_map_oa.HashMap(11, hash_function_2),
+                             window=args.window)
+    server = await start_server(service, args.host, args.port, args.unix)
+    async with server:
+        await server.serve_forever()
+
+
+async def _demo(args) -> None:
+    """Start an in-process server, load test it and print the results."""
+    service = HashMapService(hash_map_oa.HashMap(11, hash_function_2),
+                             window=args.window)
+    server = await start_server(service, args.host, args.port, args.unix)
+    async with server:
+        results = await load_test(args.host, args.port, args.unix,
+                                  args.clients, args.requests)
+    print(results, service.get_stats())
+
+
+def main() -> None:
+    """Parse command line options and run the demo, server or load test."""
+    parser = argparse.ArgumentParser(description='Batched HashMap service.')
+    parser.add_argument('mode', nargs='?', default='demo',
+                        choices=('demo', 'serve', 'loadtest'))
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', metavar='PATH', help='Unix socket path')
+    parser.add_argument('--window', type=float, default=0.0005,
+                        help='batching window in seconds')
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=500,
+                        help='requests per client')
+    args = parser.parse_args()
+
+    if args.mode == 'serve':
+        asyncio.run(_serve_forever(args))
+    elif args.mode == 'loadtest':
+        print(asyncio.run(load_test(args.host, args.port, args.unix,
+                                    args.clients, args.requests)))
+    else:
+        asyncio.run(_demo(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+# Name: Stefan Law
+# Course: CS261 - Data Structures
+# Description: Bounded-memory, single-pass approximations of find_mode for
+# high-cardinality streams: a Count-Min Sketch frequency estimator and the
+# Space-Saving and Misra-Gries top-k summaries. Each structure reports the
+# error bound of its estimates, so results can be checked against the exact
+# hash_map_sc.find_mode on inputs small enough to count exactly.
+
+import heapq
+from array import array
+from hashlib import blake2b
+from math import ceil, e, log
+
+from a6_include import DynamicArray, hash_function_2
+from hash_map_sc import CountingHashMap, HashMap, _elements, find_mode
+
+
+def _key_bytes(key) -> bytes:
+    """Return a byte encoding of key for hashing."""
+    return key.encode() if isinstance(key, str) else repr(key).encode()
+
+
+class CountMinSketch:
+    """
+    Count-Min Sketch: depth rows of width counters. estimate() never
+    undercounts, and overcounts by at most epsilon * N (N = total count
+    added) with probability at least 1 - delta. Memory is fixed by epsilon
+    and delta, independent of the number of distinct keys.
+    Supported methods are: add, estimate, error_bound, get_total
+    """
+
+    def __init__(self, epsilon: float = 0.001, delta: float = 0.01) -> None:
+        """
+        Initialize an empty sketch.
+
+        :param epsilon: relative error bound (fraction of the total count)
+        :param delta: probability that an estimate exceeds the bound
+        """
+        self._epsilon = epsilon
+        self._width = ceil(e / epsilon)
+        self._depth = ceil(log(1 / delta))
+        self._counters = array('q', [0]) * (self._width * self._depth)
+        self._total = 0
+
+    def _columns(self, key) -> list:
+        """
+        Return the counter index of key in each row. Rows use double hashing
+        of a 128-bit digest, since the sample hash functions map too many keys
+        to the same value for the error bound to hold.
+        """
+        digest = blake2b(_key_bytes(key), digest_size=16).digest()
+        hash_1 = int.from_bytes(digest[:8], 'little')
+        hash_2 = int.from_bytes(digest[8:], 'little') | 1
+        return [row * self._width + (hash_1 + row * hash_2) % self._width
+                for row in range(self._depth)]
+
+    def add(self, key, count: int = 1) -> None:
+        """
+        Add count occurrences of key. O(depth) runtime complexity.
+
+        :param key: value being counted
+        :param count: number of occurrences (int)
+        """
+        for column in self._columns(key):
+            self._counters[column] += count
+        self._total += count
+
+    def estimate(self, key) -> int:
+        """
+        Return the estimated count of key (never below the true count).
+
+        :param key: value being counted
+        :return: int
+        """
+        return min(self._counters[column] for column in self._columns(key))
+
+    def error_bound(self) -> float:
+        """Return the additive error bound epsilon * N of estimate()."""
+        return self._epsilon * self._total
+
+    def get_total(self) -> int:
+        """Return the total count added to the sketch."""
+        return self._total
+
+
+class SpaceSaving:
+    """
+    Space-Saving top-k summary. Monitors at most k keys in a HashMap; a new
+    key replaces the monitored key with the smallest count and inherits
+    that count as its error. Every key whose true count exceeds N / k is
+    monitored, and each estimate overcounts by at most its error (<= N / k).
+    Supported methods are: add, estimate, top, error_bound, get_total
+    """
+
+    def __init__(self, k: int = 1000) -> None:
+        """
+        Initialize an empty summary monitoring at most k keys.
+
+        :param k: number of counters (error bound is N / k)
+        """
+        self._k = k
+        self._counters = HashMap(2 * k, hash_function_2)
+        self._heap = []     # (count, sequence, key); may hold stale entries
+        self._sequence = 0
+        self._total = 0
+
+    def _push(self, key, count: int) -> None:
+        """Record key's current count in the min-heap."""
+        heapq.heappush(self._heap, (count, self._sequence, key))
+        self._sequence += 1
+
+    def add(self, key, count: int = 1) -> None:
+        """
+        Add count occurrences of key. O(log k) amortized runtime complexity.
+
+        :param key: value being counted
+        :param count: number of occurrences (int)
+        """
+        self._total += count
+        entry = self._counters.get(key)
+        if entry:
+            entry[0] += count
+            self._push(key, entry[0])
+        elif self._counters.get_size() < self._k:
+            self._counters.put(key, [count, 0])
+            self._push(key, count)
+        else:
+            # Pop heap entries until one matches its key's current count;
+            # that key holds the minimum count among monitored keys
+            while True:
+                minimum, _, victim = heapq.heappop(self._heap)
+                victim_entry = self._counters.get(victim)
+                if victim_entry and victim_entry[0] == minimum:
+                    break
+            self._counters.remove(victim)
+            self._counters.put(key, [minimum + count, minimum])
+            self._push(key, minimum + count)
+
+        # Drop stale heap entries once they dominate the heap
+        if len(self._heap) > 8 * self._k:
+            pairs = self._counters.get_keys_and_values()
+            self._heap = []
+            for index in range(pairs.length()):
+                key, entry = pairs[index]
+                self._push(key, entry[0])
+            heapq.heapify(self._heap)
+
+    def estimate(self, key) -> int:
+        """
+        Return the estimated count of key: an overestimate by at most the
+        key's error if monitored, otherwise 0 (its true count is then at
+        most error_bound()).
+
+        :param key: value being counted
+        :return: int
+        """
+        entry = self._counters.get(key)
+        return entry[0] if entry else 0
+
+    def top(self, n: int = None) -> DynamicArray:
+        """
+        Return the n monitored keys with the highest estimates, as a
+        DynamicArray of (key, estimate, error) tuples in descending order.
+
+        :param n: number of keys to return (all monitored keys by default)
+        :return: DynamicArray
+        """
+        pairs = self._counters.get_keys_and_values()
+        entries = [(key, entry[0], entry[1])
+                   for key, entry in (pairs[i] for i in range(pairs.length()))]
+        entries.sort(key=lambda item: item[1], reverse=True)
+        return DynamicArray(entries[:n])
+
+    def error_bound(self) -> float:
+        """Return the worst-case overcount N / k of any estimate."""
+        return self._total / self._k
+
+    def get_total(self) -> int:
+        """Return the total count added to the summary."""
+        return self._total
+
+
+class MisraGries:
+    """
+    Misra-Gries frequent-items summary with at most k - 1 counters. When a
+    new key arrives and all counters are taken, every counter is decremented
+    and zero counters are dropped. Estimates undercount by at most N / k, so
+    every key occurring more than N / k times keeps a counter.
+    Supported methods are: add, estimate, top, error_bound, get_total
+    """
+
+    def __init__(self, k: int = 1000) -> None:
+        """
+        Initialize an empty summary with at most k - 1 counters.
+
+        :param k: error bound is N / k
+        """
+        self._k = k
+        self._counters = CountingHashMap(2 * k, hash_function_2)
+        self._total = 0
+
+    def add(self, key) -> None:
+        """
+        Add one occurrence of key. O(1) amortized runtime complexity: each
+        O(k) decrement pass is paid for by the k increments it cancels.
+
+        :param key: value being counted
+        """
+        self._total += 1
+        if (self._counters.get_size() < self._k - 1
+                or self._counters.contains_key(key)):
+            self._counters.increment(key)
+            return
+
+        pairs = self._counters.get_keys_and_values()
+        for index in range(pairs.length()):
+            victim, count = pairs[index]
+            if count == 1:
+                self._counters.remove(victim)
+            else:
+                self._counters.increment(victim, -1)
+
+    def estimate(self, key) -> int:
+        """
+        Return the estimated count of key (never above the true count, and
+        at most error_bound() below it).
+
+        :param key: value being counted
+        :return: int
+        """
+        return self._counters.count(key)
+
+    def top(self, n: int = None) -> DynamicArray:
+        """
+        Return the n counted keys with the highest estimates, as a
+        DynamicArray of (key, estimate) tuples in descending order.
+
+        :param n: number of keys to return (all counted keys by default)
+        :return: DynamicArray
+        """
+        pairs = self._counters.get_keys_and_values()
+        entries = [pairs[i] for i in range(pairs.length())]
+        entries.sort(key=lambda item: item[1], reverse=True)
+        return DynamicArray(entries[:n])
+
+    def error_bound(self) -> float:
+        """Return the worst-case undercount N / k of any estimate."""
+        return self._total / self._k
+
+    def get_total(self) -> int:
+        """Return the total count added to the summary."""
+        return self._total
+
+
+def find_mode_approx(source, k: int = 1000) -> tuple[DynamicArray, int, float]:
+    """
+    Approximate find_mode in one pass and O(k) memory using Space-Saving.
+    Returns the monitored value(s) with the highest estimated frequency,
+    that estimate, and its error bound N / k: the true mode frequency lies
+    within [estimate - bound, estimate], and the answer is exact whenever
+    the input has fewer than k distinct values.
+
+    :param: source (iterable or DynamicArray)
+    :param: k (int, number of counters)
+    :returns: tuple (DynamicArray, int, float)
+    """
+    summary = SpaceSaving(k)
+    for key in _elements(source):
+        summary.add(key)
+
+    output_arr = DynamicArray()
+    top = summary.top()
+    freq = top[0][1] if top.length() else 0
+    index = 0
+    while index != top.length() and top[index][1] == freq:
+        output_arr.append(top[index][0])
+        index += 1
+
+    return output_arr, freq, summary.error_bound()
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    import random
+
+    rng = random.Random(325)
+    values = ['v' + str(rank) for rank in range(1, 20001)]
+    weights = [1 / rank for rank in range(1, 20001)]
+    stream = rng.choices(values, weights=weights, k=100000)
+
+    print("\nexact find_mode vs find_mode_approx (Zipf stream)")
+    print("-------------------------------------------------")
+    mode, frequency = find_mode(DynamicArray(stream))
+    print(f"exact : {mode}, Frequency: {frequency}")
+    mode, estimate, bound = find_mode_approx(stream, k=200)
+    print(f"approx: {mode}, Frequency: {estimate} (error <= {bound:.0f})")
+    print(estimate - bound <= frequency <= estimate)
+
+    print("\nerror bounds against exact counts")
+    print("---------------------------------")
+    exact = CountingHashMap(11, hash_function_2)
+    sketch = CountMinSketch(epsilon=0.001, delta=0.01)
+    misra_gries = MisraGries(k=200)
+    for value in stream:
+        exact.increment(value)
+        sketch.add(value)
+        misra_gries.add(value)
+    within = True
+    for value in values[:500]:
+        true = exact.count(value)
+        within &= true <= sketch.estimate(value) <= true + sketch.error_bound()
+        within &= true - misra_gries.error_bound() <= misra_gries.estimate(value) <= true
+    print(within, misra_gries.top(3))
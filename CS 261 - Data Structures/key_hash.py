@@ -0,0 +1,102 @@
+# Name: Stefan Law
+# Course: CS261 - Data Structures
+# Description: Key adapter layer for the HashMaps (separate chaining, open
+# addressing, cuckoo and swiss tables), which lets their keys be any hashable
+# object. The sample hash functions iterate over the characters of a string,
+# so on their own the maps only accept str keys. hash_key() dispatches on the
+# key's type instead: strings go to the map's hash function, ints get a
+# multiplicative mix with no per-digit loop, bytes are hashed in bulk by
+# zlib.crc32, tuples combine the hashes of their fields, and any other
+# hashable mixes Python's hash(). All results are non-negative.
+
+from zlib import crc32
+
+# Results are reduced to 64 bits
+HASH_MASK = (1 << 64) - 1
+
+# Fibonacci hashing multiplier (2 ** 64 / golden ratio)
+GOLDEN = 0x9E3779B97F4A7C15
+
+
+def mix_int(key: int) -> int:
+    """
+    Return a 64-bit hash of an integer key: a multiply by the golden ratio
+    constant, with the high half folded into the low half so that small
+    and consecutive keys differ in their low bits too. Python's own hash
+    (the identity for small ints) is mixed, which folds in ints wider than
+    64 bits and lets any other hashable use this too: keys that compare
+    equal, such as 1 and 1.0, get equal hashes.
+    """
+    mixed = ((hash(key) & HASH_MASK) * GOLDEN) & HASH_MASK
+    return mixed ^ (mixed >> 32)
+
+
+def hash_bytes(key: bytes) -> int:
+    """Return a hash of a bytes key computed in one pass over it."""
+    return crc32(key) * GOLDEN & HASH_MASK
+
+
+def hash_tuple(key: tuple, function: callable) -> int:
+    """
+    Return a hash of a tuple key, combining the hashes of its fields in
+    order (the boost::hash_combine recurrence).
+    """
+    combined = len(key)
+    for field in key:
+        combined ^= (hash_key(field, function) + GOLDEN
+                     + (combined << 6) + (combined >> 2)) & HASH_MASK
+    return combined
+
+
+def hash_key(key: object, function: callable) -> int:
+    """
+    Return a non-negative hash of any hashable key. Strings keep using
+    function, so maps of str keys place their entries exactly as before.
+
+    :param: key (any hashable object)
+    :param: function (the map's string hash function)
+    :return: int
+    """
+    kind = type(key)
+    if kind is str:
+        return function(key)
+    if kind is int:
+        return mix_int(key)
+    if isinstance(key, bytes):
+        return hash_bytes(key)
+    if isinstance(key, tuple):
+        return hash_tuple(key, function)
+    if isinstance(key, str):
+        return function(str(key))
+    return mix_int(key)
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    from a6_include import hash_function_1, hash_function_2
+
+    print("\nhash_key by type")
+    print("----------------")
+    for key in ('abc', 0, 1, -1, 2 ** 70, True, b'abc', ('abc', 1),
+                (1, 'abc'), (), 3.5, frozenset({1, 2})):
+        print(repr(key), hash_key(key, hash_function_1))
+    print(hash_key(1.0, hash_function_1) == hash_key(1, hash_function_1))
+    from collections import namedtuple
+    Point = namedtuple('Point', 'x y')
+    print(hash_key(Point(1, 2), hash_function_1) == hash_key((1, 2), hash_function_1))
+
+    class Payload(bytes):
+        pass
+    print(hash_key(Payload(b'ab'), hash_function_1) == hash_key(b'ab', hash_function_1))
+    print(hash_key('abc', hash_function_1) == hash_function_1('abc'),
+          hash_key('abc', hash_function_2) == hash_function_2('abc'))
+
+    print("\nconsecutive ints, low bits")
+    print("--------------------------")
+    print([mix_int(i) % 11 for i in range(20)])
+    try:
+        hash_key(bytearray(b'mutable'), hash_function_1)
+    except TypeError as error:
+        print("TypeError:", error)
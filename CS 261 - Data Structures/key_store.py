@@ -0,0 +1,326 @@
+# Name: Stefan Law
+# Course: CS261 - Data Structures
+# Description: Interning, prefix-compressed key store for HashMaps with many
+# long string keys that share prefixes (URLs, file paths). Each distinct key
+# is stored once as an integer id: the id of its parent prefix (everything up
+# to the last separator, itself interned) plus the remaining suffix bytes in
+# a shared bytearray arena. HashMaps then hold small int ids instead of
+# separate str objects: key_hash mixes an id with one multiply instead of a
+# pass over the key's characters, and key equality inside the map is an int
+# comparison.
+
+import re
+from array import array
+
+import hash_map_sc
+from a6_include import DynamicArray, hash_function_2
+from key_hash import mix_int
+
+
+class KeyStore:
+    """
+    Append-only store of interned string keys.
+    Supported methods are: intern, find, key, hash, get_size, memory_usage
+    """
+
+    # Marks an empty slot in the intern table / a key without a prefix
+    EMPTY = -1
+
+    # Cached hashes are kept to 63 bits so they fit a signed 'q' array
+    HASH_MASK = 2 ** 63 - 1
+
+    def __init__(self,
+                 capacity: int = 1024,
+                 function: callable = hash_function_2,
+                 separators: str = '/') -> None:
+        """
+        Initialize an empty key store.
+
+        :param capacity: initial number of slots in the intern table
+                         (rounded up to a power of two, at least 8)
+        :param function: string hash function applied to each key piece
+        :param separators: characters at which keys are split into an
+                           interned prefix and a stored suffix
+        """
+        self._hash_function = function
+        self._separators = separators
+
+        # A cut falls after every separator except one that ends the key
+        self._cut = re.compile('[%s](?!\\Z)' % re.escape(separators))
+
+        # Per-id columns: parent prefix id, suffix position in the arena,
+        # suffix length in bytes and cached (masked) hash of the full key,
+        # chained over its pieces
+        self._prefix = array('i')
+        self._offset = array('q')
+        self._length = array('i')
+        self._hash = array('q')
+        self._arena = bytearray()
+
+        # Open addressing table of ids, probed with triangular steps
+        # (i + j * (j + 1) / 2), which visit every slot of a power-of-two table
+        self._capacity = 1 << max(capacity - 1, 7).bit_length()
+        self._table = array('i', [self.EMPTY]) * self._capacity
+
+    def get_size(self) -> int:
+        """Return number of distinct keys (prefixes included) in the store."""
+        return len(self._hash)
+
+    def memory_usage(self) -> int:
+        """Return approximate bytes used by the arena, columns and table."""
+        columns = (self._prefix, self._offset, self._length, self._hash,
+                   self._table)
+        return len(self._arena) + sum(len(column) * column.itemsize
+                                      for column in columns)
+
+    def _pieces(self, key: str):
+        """
+        Yield (hash, suffix bytes) for key and each of its prefixes, shortest
+        first. Key is cut after every separator (ignoring a trailing one);
+        each piece's suffix is the text after the previous cut, and its hash
+        chains the previous piece's hash with the hash function applied to
+        the suffix, so every character of key is hashed once.
+        """
+        hash = 0
+        start = 0
+        for cut in self._cut.finditer(key):
+            suffix = key[start:cut.end()]
+            hash = mix_int(hash ^ self._hash_function(suffix)) & self.HASH_MASK
+            yield hash, suffix.encode()
+            start = cut.end()
+        suffix = key[start:]
+        hash = mix_int(hash ^ self._hash_function(suffix)) & self.HASH_MASK
+        yield hash, suffix.encode()
+
+    def _probe(self, hash: int, prefix_id: int, suffix: bytes) -> int:
+        """
+        Return the intern table slot holding the key described by
+        (hash, prefix_id, suffix), or the empty slot where it belongs.
+        Candidates are compared by cached hash first, then by prefix id,
+        and only then by suffix bytes.
+        """
+        index = hash % self._capacity
+        step = 1
+        while True:
+            key_id = self._table[index]
+            if key_id == self.EMPTY:
+                return index
+            if (self._hash[key_id] == hash
+                    and self._prefix[key_id] == prefix_id
+                    and self._length[key_id] == len(suffix)):
+                offset = self._offset[key_id]
+                if self._arena[offset:offset + len(suffix)] == suffix:
+                    return index
+            index = (index + step) % self._capacity
+            step += 1
+
+    def _resize(self) -> None:
+        """Double the intern table (keeping it at most half full)."""
+        self._capacity *= 2
+        self._table = array('i', [self.EMPTY]) * self._capacity
+        for key_id in range(len(self._hash)):
+            index = self._hash[key_id] % self._capacity
+            step = 1
+            while self._table[index] != self.EMPTY:
+                index = (index + step) % self._capacity
+                step += 1
+            self._table[index] = key_id
+
+    def intern(self, key: str) -> int:
+        """
+        Return the id of key, adding it (and its prefixes) to the store if
+        it is not there yet. Equal keys always receive the same id.
+
+        :param key: string key
+        :return: int id
+        """
+        key_id = self.EMPTY
+        for hash, suffix in self._pieces(key):
+            prefix_id = key_id
+            index = self._probe(hash, prefix_id, suffix)
+            key_id = self._table[index]
+            if key_id != self.EMPTY:
+                continue
+
+            key_id = len(self._hash)
+            self._prefix.append(prefix_id)
+            self._offset.append(len(self._arena))
+            self._length.append(len(suffix))
+            self._hash.append(hash)
+            self._arena += suffix
+            self._table[index] = key_id
+
+            if 2 * len(self._hash) >= self._capacity:
+                self._resize()
+        return key_id
+
+    def find(self, key: str) -> int:
+        """
+        Return the id of key, or None if it was never interned. Does not
+        add anything to the store.
+
+        :param key: string key
+        :return: int id or None
+        """
+        key_id = self.EMPTY
+        for hash, suffix in self._pieces(key):
+            key_id = self._table[self._probe(hash, key_id, suffix)]
+            if key_id == self.EMPTY:
+                return None
+        return key_id
+
+    def key(self, key_id: int) -> str:
+        """
+        Rebuild the string key stored under key_id.
+
+        :param key_id: id returned by intern
+        :return: string key
+        """
+        parts = []
+        while key_id != self.EMPTY:
+            offset = self._offset[key_id]
+            parts.append(self._arena[offset:offset + self._length[key_id]])
+            key_id = self._prefix[key_id]
+        parts.reverse()
+        return b''.join(parts).decode()
+
+    def hash(self, key_id: int) -> int:
+        """
+        Return the cached hash of the key stored under key_id, the value
+        the intern table is probed with.
+
+        :param key_id: id returned by intern
+        :return: int hash
+        """
+        return self._hash[key_id]
+
+
+class InternedHashMap:
+    """
+    HashMap facade that stores keys in a KeyStore and keeps only their ids
+    in an underlying separate chaining or open addressing HashMap.
+    Supported methods match the HashMaps: put, get, contains_key, remove,
+    resize_table, table_load, empty_buckets, get_keys_and_values, clear,
+    get_size, get_capacity
+    """
+
+    def __init__(self,
+                 capacity: int = 11,
+                 map_type: type = hash_map_sc.HashMap,
+                 store: KeyStore = None) -> None:
+        """
+        Initialize an empty map. Several maps may share one store so that
+        keys common to all of them are stored once.
+
+        :param capacity: initial capacity of the underlying HashMap
+        :param map_type: HashMap class taking (capacity, hash function)
+        :param store: KeyStore to intern keys into (a new one by default)
+        """
+        self._store = store if store is not None else KeyStore()
+        # Ids are int keys, which key_hash.hash_key mixes directly; the
+        # map's string hash function is never called on them
+        self._map = map_type(capacity, hash_function_2)
+
+    def get_store(self) -> KeyStore:
+        """Return the KeyStore holding this map's keys."""
+        return self._store
+
+    def get_size(self) -> int:
+        """Return size of map"""
+        return self._map.get_size()
+
+    def get_capacity(self) -> int:
+        """Return capacity of map"""
+        return self._map.get_capacity()
+
+    def put(self, key: str, value: object) -> None:
+        """Intern key and store value under its id."""
+        self._map.put(self._store.intern(key), value)
+
+    def get(self, key: str) -> object:
+        """Return value stored for key, or None if key is not in the map."""
+        key_id = self._store.find(key)
+        if key_id is None:
+            return None
+        return self._map.get(key_id)
+
+    def contains_key(self, key: str) -> bool:
+        """Return True if key is in the map, otherwise False."""
+        key_id = self._store.find(key)
+        return key_id is not None and self._map.contains_key(key_id)
+
+    def remove(self, key: str) -> None:
+        """
+        Remove key from the map. The key stays interned in the store, which
+        is append-only.
+        """
+        key_id = self._store.find(key)
+        if key_id is not None:
+            self._map.remove(key_id)
+
+    def resize_table(self, new_capacity: int) -> None:
+        """Resize the underlying HashMap; int ids rehash without their keys."""
+        self._map.resize_table(new_capacity)
+
+    def table_load(self) -> float:
+        """Return load factor of the underlying HashMap."""
+        return self._map.table_load()
+
+    def empty_buckets(self) -> int:
+        """Return number of empty buckets in the underlying HashMap."""
+        return self._map.empty_buckets()
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray containing tuples of all stored key/value
+        pairs, with keys rebuilt from the store.
+        """
+        pairs = self._map.get_keys_and_values()
+        output_arr = DynamicArray()
+        index = 0
+        while index != pairs.length():
+            key_id, value = pairs[index]
+            output_arr.append((self._store.key(key_id), value))
+            index += 1
+        return output_arr
+
+    def clear(self) -> None:
+        """Remove all key/value pairs; the store keeps its interned keys."""
+        self._map.clear()
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    import sys
+
+    import hash_map_oa
+
+    print("\nKeyStore - interning and prefix sharing")
+    print("---------------------------------------")
+    store = KeyStore()
+    urls = ['https://example.com/docs/' + str(i) + '/index.html'
+            for i in range(1000)]
+    ids = [store.intern(url) for url in urls]
+    print(ids[:3], store.intern(urls[1]) == ids[1], store.find('nope'))
+    print(store.key(ids[999]) == urls[999], store.get_size())
+    print(store.memory_usage(), 'bytes vs',
+          sum(sys.getsizeof(url) for url in urls), 'bytes of str objects')
+
+    print("\nInternedHashMap - separate chaining and open addressing")
+    print("-------------------------------------------------------")
+    for map_type in (hash_map_sc.HashMap, hash_map_oa.HashMap):
+        m = InternedHashMap(53, map_type, store)
+        for i, url in enumerate(urls):
+            m.put(url, i)
+        m.remove(urls[0])
+        m.put(urls[1], 'one')
+        result = True
+        for i, url in enumerate(urls[2:], 2):
+            result &= m.get(url) == i
+        print(map_type.__module__, result, m.get_size(),
+              m.contains_key(urls[0]), m.get(urls[1]),
+              m.contains_key('https://example.com/docs/1000/index.html'))
+        pairs = m.get_keys_and_values()
+        print(pairs.length(), min(pairs[i] for i in range(pairs.length())))
@@ -0,0 +1,299 @@
+# Name: Stefan Law
+# Course: CS261 - Data Structures
+# Description: Sharded HashMap facade. Keys are routed by
+# hash_key(key, hash_function_2) % n_shards to one of n_shards separate chaining or
+# open addressing HashMaps, each owned by its own worker process. Batched
+# put_many / get_many calls are split per shard and sent to every shard
+# before any reply is awaited, so the shards work on a batch in parallel.
+
+from multiprocessing import Pipe, Process
+from multiprocessing.reduction import ForkingPickler
+
+import hash_map_oa
+import hash_map_sc
+from a6_include import DynamicArray, hash_function_2
+from key_hash import hash_key
+
+
+# Map kind -> HashMap class run by each shard
+MAP_TYPES = {
+    'sc': hash_map_sc.HashMap,
+    'oa': hash_map_oa.HashMap,
+}
+
+
+def _shard_worker(connection, map_kind: str, capacity: int) -> None:
+    """
+    Serve one shard: own a HashMap and apply the (operation, payload)
+    requests received on connection until told to close. Every request gets
+    exactly one reply; an operation that raises replies with its exception,
+    so one bad request does not stop the shard.
+    """
+    map = MAP_TYPES[map_kind](capacity, hash_function_2)
+    while True:
+        operation, payload = connection.recv()
+        if operation == 'close':
+            connection.send(None)
+            break
+        try:
+            reply = _apply(map, operation, payload)
+        except Exception as error:
+            reply = error
+
+        try:
+            connection.send(reply)
+        except Exception as error:
+            # The reply could not be pickled (nothing was written)
+            connection.send(RuntimeError(repr(error)))
+
+    connection.close()
+
+
+def _apply(map, operation: str, payload: object) -> object:
+    """
+    Apply one shard request to map and return the reply to send back.
+    """
+    if operation == 'put_many':
+        for key, value in payload:
+            map.put(key, value)
+        return None
+    if operation == 'get_many':
+        return [map.get(key) for key in payload]
+    if operation == 'contains_many':
+        return [map.contains_key(key) for key in payload]
+    if operation == 'remove_many':
+        for key in payload:
+            map.remove(key)
+        return None
+    if operation == 'stats':
+        return map.get_size(), map.get_capacity(), map.empty_buckets()
+    if operation == 'items':
+        pairs = map.get_keys_and_values()
+        return [pairs[index] for index in range(pairs.length())]
+    if operation == 'resize':
+        map.resize_table(payload)
+        return None
+    if operation == 'clear':
+        map.clear()
+        return None
+    return ValueError('unknown operation ' + repr(operation))
+
+
+class ShardedHashMap:
+    """
+    HashMap facade partitioning keys across worker-owned shards.
+    Supported methods are: put, get, contains_key, remove, put_many,
+    get_many, contains_many, remove_many, resize_table, table_load,
+    empty_buckets, get_keys_and_values, clear, get_size, get_capacity, close
+    """
+
+    def __init__(self,
+                 n_shards: int = 4,
+                 map_kind: str = 'sc',
+                 capacity: int = 11) -> None:
+        """
+        Start n_shards worker processes, each owning an empty HashMap.
+
+        :param n_shards: number of shards / worker processes
+        :param map_kind: 'sc' (separate chaining) or 'oa' (open addressing)
+        :param capacity: initial capacity of each shard's HashMap
+        """
+        if map_kind not in MAP_TYPES:
+            raise ValueError('map_kind must be one of ' + ', '.join(MAP_TYPES))
+
+        self._n_shards = n_shards
+        self._connections = []
+        self._workers = []
+        for _ in range(n_shards):
+            parent, child = Pipe()
+            worker = Process(target=_shard_worker,
+                             args=(child, map_kind, capacity), daemon=True)
+            worker.start()
+            child.close()
+            self._connections.append(parent)
+            self._workers.append(worker)
+
+    def __enter__(self) -> "ShardedHashMap":
+        """Return the map for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stop the workers when leaving a with statement."""
+        self.close()
+
+    def _shard(self, key: str) -> int:
+        """Return the index of the shard owning key."""
+        return hash_key(key, hash_function_2) % self._n_shards
+
+    def _broadcast(self, operation: str, payload: object = None) -> list:
+        """Send one request to every shard and return their replies."""
+        replies = self._exchange({shard: (operation, payload)
+                                  for shard in range(self._n_shards)})
+        return list(replies.values())
+
+    def _exchange(self, requests: dict) -> dict:
+        """
+        Send each shard its request and return {shard: reply}. Every request
+        is pickled before any is sent, and every sent request's reply is read
+        before an error is raised, so a failure cannot leave a stale reply
+        in a pipe for the next call to read.
+        """
+        messages = {shard: ForkingPickler.dumps(request)
+                    for shard, request in requests.items()}
+        for shard, message in messages.items():
+            self._connections[shard].send_bytes(message)
+
+        replies = {shard: self._connections[shard].recv() for shard in messages}
+        for reply in replies.values():
+            if isinstance(reply, Exception):
+                raise reply
+        return replies
+
+    def _scatter(self, operation: str, items: list, key_of) -> list:
+        """
+        Group items by shard, send each group to its shard, then gather the
+        replies. Returns per-item results in the original order (None for
+        operations that return nothing).
+        """
+        groups = [[] for _ in range(self._n_shards)]
+        positions = [[] for _ in range(self._n_shards)]
+        for position, item in enumerate(items):
+            shard = self._shard(key_of(item))
+            groups[shard].append(item)
+            positions[shard].append(position)
+
+        replies = self._exchange({shard: (operation, groups[shard])
+                                  for shard in range(self._n_shards)
+                                  if groups[shard]})
+
+        results = [None] * len(items)
+        for shard, reply in replies.items():
+            if reply is not None:
+                for position, result in zip(positions[shard], reply):
+                    results[position] = result
+        return results
+
+    def put_many(self, pairs) -> None:
+        """
+        Add (key, value) pairs, updating keys already present.
+
+        :param pairs: iterable of (key, value) tuples
+        """
+        self._scatter('put_many', list(pairs), lambda pair: pair[0])
+
+    def get_many(self, keys) -> list:
+        """
+        Return the values of keys (None for absent keys), in order.
+
+        :param keys: iterable of keys
+        :return: list of values
+        """
+        return self._scatter('get_many', list(keys), lambda key: key)
+
+    def contains_many(self, keys) -> list:
+        """
+        Return whether each key is in the map, in order.
+
+        :param keys: iterable of keys
+        :return: list of bools
+        """
+        return self._scatter('contains_many', list(keys), lambda key: key)
+
+    def remove_many(self, keys) -> None:
+        """
+        Remove keys from the map; absent keys are ignored.
+
+        :param keys: iterable of keys
+        """
+        self._scatter('remove_many', list(keys), lambda key: key)
+
+    def put(self, key: str, value: object) -> None:
+        """Add key/value pair, or update key's value if present."""
+        self.put_many([(key, value)])
+
+    def get(self, key: str) -> object:
+        """Return value associated with key, or None."""
+        return self.get_many([key])[0]
+
+    def contains_key(self, key: str) -> bool:
+        """Return True if key is in the map, otherwise False."""
+        return self.contains_many([key])[0]
+
+    def remove(self, key: str) -> None:
+        """Remove key from the map if present."""
+        self.remove_many([key])
+
+    def resize_table(self, new_capacity: int) -> None:
+        """Resize every shard to an equal share of new_capacity."""
+        self._broadcast('resize', max(1, new_capacity // self._n_shards))
+
+    def get_size(self) -> int:
+        """Return total number of entries across shards."""
+        return sum(stats[0] for stats in self._broadcast('stats'))
+
+    def get_capacity(self) -> int:
+        """Return total capacity across shards."""
+        return sum(stats[1] for stats in self._broadcast('stats'))
+
+    def table_load(self) -> float:
+        """Return aggregate load factor (total entries / total capacity)."""
+        stats = self._broadcast('stats')
+        return sum(s[0] for s in stats) / sum(s[1] for s in stats)
+
+    def empty_buckets(self) -> int:
+        """Return total number of empty buckets across shards."""
+        return sum(stats[2] for stats in self._broadcast('stats'))
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray containing tuples of all key/value pairs,
+        shard by shard.
+        """
+        output_arr = DynamicArray()
+        for pairs in self._broadcast('items'):
+            for pair in pairs:
+                output_arr.append(pair)
+        return output_arr
+
+    def clear(self) -> None:
+        """Remove all key/value pairs from every shard."""
+        self._broadcast('clear')
+
+    def close(self) -> None:
+        """Stop the worker processes. The map is unusable afterwards."""
+        if not self._workers:
+            return
+        self._broadcast('close')
+        for worker in self._workers:
+            worker.join()
+        for connection in self._connections:
+            connection.close()
+        self._workers = []
+        self._connections = []
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    import time
+
+    for map_kind in ('sc', 'oa'):
+        print(f"\nShardedHashMap - {map_kind}")
+        print("---------------------------")
+        with ShardedHashMap(4, map_kind) as m:
+            keys = ['key' + str(i) for i in range(20000)]
+            start = time.perf_counter()
+            m.put_many((key, i) for i, key in enumerate(keys))
+            values = m.get_many(keys)
+            elapsed = time.perf_counter() - start
+            print(values == list(range(20000)), m.get_size(),
+                  round(m.table_load(), 2), f"{elapsed:.2f}s")
+
+            m.remove_many(keys[:10000])
+            m.put('key1', 'one')
+            print(m.get('key1'), m.get('key10000'), m.contains_key('key2'),
+                  m.contains_many(['key9999', 'key19999', 'nope']))
+            print(m.get_size(), m.get_keys_and_values().length())
+            m.clear()
+            print(m.get_size(), m.get_capacity() > 0)
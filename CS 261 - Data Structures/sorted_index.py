@@ -0,0 +1,294 @@
+# Name: Stefan Law
+# Course: CS261 - Data Structures
+# Description: Ordered secondary index for the HashMaps. A skip list over
+# the map's keys is kept in step with put and remove, so range queries,
+# prefix scans and min/max run in O(log n + k) instead of dumping the map
+# with get_keys_and_values() and sorting it. Point lookups stay on the hash
+# path.
+
+import random
+
+from a6_include import DynamicArray
+
+
+class SkipNode:
+    """
+    Skip list node holding a key and one forward pointer per level
+    """
+
+    def __init__(self, key: str, level: int) -> None:
+        """Initialize node given a key and its number of levels."""
+        self.key = key
+        self.forward = [None] * level
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        return '(' + str(self.key) + ')'
+
+
+class SkipList:
+    """
+    Class implementing a sorted set of keys as a skip list
+    Supported methods are: insert, remove, contains, min, max, range,
+    prefix, length
+    """
+
+    MAX_LEVEL = 32
+    P = 0.25
+
+    def __init__(self, seed: int = 0) -> None:
+        """
+        Initialize an empty skip list. Levels are drawn from a seeded
+        generator so that the structure is reproducible.
+        """
+        self._head = SkipNode(None, self.MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        self._random = random.Random(seed)
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        return 'SKL [' + ', '.join(str(key) for key in self) + ']'
+
+    def __iter__(self):
+        """Iterate over the keys in ascending order."""
+        node = self._head.forward[0]
+        while node:
+            yield node.key
+            node = node.forward[0]
+
+    def length(self) -> int:
+        """Return the number of keys."""
+        return self._size
+
+    def _random_level(self) -> int:
+        """Return a level drawn from a geometric distribution."""
+        level = 1
+        while level < self.MAX_LEVEL and self._random.random() < self.P:
+            level += 1
+        return level
+
+    def _predecessors(self, key: str) -> list:
+        """
+        Return, for every level, the last node whose key is below key.
+        """
+        update = [self._head] * self.MAX_LEVEL
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            while node.forward[level] and node.forward[level].key < key:
+                node = node.forward[level]
+            update[level] = node
+        return update
+
+    def _lower_bound(self, key: str) -> SkipNode:
+        """Return the first node whose key is >= key, or None."""
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            while node.forward[level] and node.forward[level].key < key:
+                node = node.forward[level]
+        return node.forward[0]
+
+    def insert(self, key: str) -> bool:
+        """
+        Insert key. O(log n) expected runtime complexity.
+        Return True if the key was added, False if it was already present.
+        """
+        update = self._predecessors(key)
+        candidate = update[0].forward[0]
+        if candidate and candidate.key == key:
+            return False
+
+        level = self._random_level()
+        if level > self._level:
+            self._level = level
+        node = SkipNode(key, level)
+        for i in range(level):
+            node.forward[i] = update[i].forward[i]
+            update[i].forward[i] = node
+        self._size += 1
+        return True
+
+    def remove(self, key: str) -> bool:
+        """
+        Remove key. O(log n) expected runtime complexity.
+        Return True if removal was successful, False otherwise.
+        """
+        update = self._predecessors(key)
+        node = update[0].forward[0]
+        if not node or node.key != key:
+            return False
+
+        for i in range(len(node.forward)):
+            update[i].forward[i] = node.forward[i]
+        while self._level > 1 and not self._head.forward[self._level - 1]:
+            self._level -= 1
+        self._size -= 1
+        return True
+
+    def contains(self, key: str) -> bool:
+        """Return True if key is in the list, otherwise False."""
+        node = self._lower_bound(key)
+        return node is not None and node.key == key
+
+    def min(self) -> str:
+        """Return the smallest key, or None if the list is empty."""
+        node = self._head.forward[0]
+        return node.key if node else None
+
+    def max(self) -> str:
+        """Return the largest key, or None if the list is empty."""
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            while node.forward[level]:
+                node = node.forward[level]
+        return node.key
+
+    def range(self, lo: str, hi: str):
+        """Iterate over the keys k with lo <= k <= hi, in ascending order."""
+        node = self._lower_bound(lo)
+        while node and node.key <= hi:
+            yield node.key
+            node = node.forward[0]
+
+    def prefix(self, prefix: str):
+        """Iterate over the keys starting with prefix, in ascending order."""
+        node = self._lower_bound(prefix)
+        while node and node.key.startswith(prefix):
+            yield node.key
+            node = node.forward[0]
+
+
+class IndexedHashMap:
+    """
+    HashMap wrapper that maintains a SkipList over the keys of any of the
+    HashMap implementations. Point operations go to the wrapped map; ordered
+    queries (range, prefix, min, max) use the index.
+    Supported methods are the HashMap's (put, get, contains_key, remove,
+    resize_table, table_load, empty_buckets, get_keys_and_values, clear,
+    get_size, get_capacity) plus range, prefix, min, max
+    """
+
+    def __init__(self, map) -> None:
+        """
+        Wrap map, indexing any keys it already holds. The map must only be
+        modified through this wrapper from now on.
+        """
+        self._map = map
+        self._index = SkipList()
+        pairs = map.get_keys_and_values()
+        for index in range(pairs.length()):
+            self._index.insert(pairs[index][0])
+
+    def get_size(self) -> int:
+        """Return size of map"""
+        return self._map.get_size()
+
+    def get_capacity(self) -> int:
+        """Return capacity of map"""
+        return self._map.get_capacity()
+
+    def put(self, key: str, value: object) -> None:
+        """Add or update key/value pair; new keys are added to the index."""
+        size = self._map.get_size()
+        self._map.put(key, value)
+        if self._map.get_size() > size:
+            self._index.insert(key)
+
+    def get(self, key: str) -> object:
+        """Return value associated with key, or None (hash lookup)."""
+        return self._map.get(key)
+
+    def contains_key(self, key: str) -> bool:
+        """Return True if key is in the map, otherwise False (hash lookup)."""
+        return self._map.contains_key(key)
+
+    def remove(self, key: str) -> None:
+        """Remove key from the map and the index."""
+        size = self._map.get_size()
+        self._map.remove(key)
+        if self._map.get_size() < size:
+            self._index.remove(key)
+
+    def resize_table(self, new_capacity: int) -> None:
+        """Resize the wrapped map; the index is unaffected."""
+        self._map.resize_table(new_capacity)
+
+    def table_load(self) -> float:
+        """Return load factor of the wrapped map."""
+        return self._map.table_load()
+
+    def empty_buckets(self) -> int:
+        """Return number of empty buckets in the wrapped map."""
+        return self._map.empty_buckets()
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """Return all key/value pairs, in ascending key order."""
+        return self._pairs(iter(self._index))
+
+    def clear(self) -> None:
+        """Remove all key/value pairs from the map and the index."""
+        self._map.clear()
+        self._index = SkipList()
+
+    def _pairs(self, keys) -> DynamicArray:
+        """Return a DynamicArray of (key, value) tuples for keys."""
+        output_arr = DynamicArray()
+        for key in keys:
+            output_arr.append((key, self._map.get(key)))
+        return output_arr
+
+    def range(self, lo: str, hi: str) -> DynamicArray:
+        """
+        Return (key, value) tuples for keys with lo <= key <= hi, in
+        ascending key order. O(log n + k) expected runtime complexity.
+        """
+        return self._pairs(self._index.range(lo, hi))
+
+    def prefix(self, prefix: str) -> DynamicArray:
+        """
+        Return (key, value) tuples for keys starting with prefix, in
+        ascending key order. O(log n + k) expected runtime complexity.
+        """
+        return self._pairs(self._index.prefix(prefix))
+
+    def min(self) -> str:
+        """Return the smallest key, or None if the map is empty."""
+        return self._index.min()
+
+    def max(self) -> str:
+        """Return the largest key, or None if the map is empty."""
+        return self._index.max()
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    import hash_map_oa
+    import hash_map_sc
+    from a6_include import hash_function_2
+
+    print("\nSkipList")
+    print("--------")
+    skip_list = SkipList()
+    for key in ('m', 'c', 'x', 'a', 'q', 'c'):
+        skip_list.insert(key)
+    skip_list.remove('q')
+    print(skip_list, skip_list.length(), skip_list.min(), skip_list.max(),
+          skip_list.contains('x'), list(skip_list.range('b', 'n')))
+
+    for m in (hash_map_sc.HashMap(11, hash_function_2),
+              hash_map_oa.HashMap(11, hash_function_2)):
+        print("\nIndexedHashMap -", type(m).__module__)
+        print("--------------------------")
+        m = IndexedHashMap(m)
+        for i in range(1000):
+            m.put('/usr/lib/file' + str(i).zfill(4), i)
+        m.put('/usr/bin/python', 'py')
+        m.put('/usr/lib/file0001', 'updated')
+        m.remove('/usr/lib/file0002')
+        m.remove('/not/there')
+        print(m.get_size(), m.min(), m.max(), m.get('/usr/bin/python'))
+        print(m.range('/usr/lib/file0000', '/usr/lib/file0004'))
+        print(m.prefix('/usr/lib/file099'))
+        print(m.prefix('/usr/bin'), m.prefix('/opt'))
@@ -0,0 +1,345 @@
+# Name: Stefan Law
+# Course: CS261 - Data Structures
+# Assignment: 6 - swiss_table
+# Description: Python implementation of an open addressing hash map with
+# SwissTable-style grouped metadata. Besides the entry slots, the table keeps
+# one control byte per slot (empty, deleted, or 7 bits of the key's hash).
+# Slots are probed a group of 16 at a time: the group's control bytes are
+# compared against the key's 7-bit tag in one vectorized operation (a C-level
+# byte search, or NumPy on request), and only slots whose tag
+# matches have their keys compared. Groups are visited in triangular order,
+# which covers every group of a power-of-two table. Keys are hashed through
+# key_hash.hash_key.
+
+from a6_include import DynamicArray, HashEntry, hash_function_1
+from key_hash import hash_key
+
+
+class HashMap:
+    # Number of slots whose control bytes are checked together
+    GROUP_SIZE = 16
+
+    # Control byte values; full slots hold a 7-bit tag (0x00 - 0x7F)
+    EMPTY = 0x80
+    DELETED = 0xFE
+
+    # The table is grown (or purged of deleted slots) once full and deleted
+    # slots reach this fraction of all slots
+    MAX_LOAD = 7 / 8
+
+    def __init__(self,
+                 capacity: int = 16,
+                 function: callable = hash_function_1,
+                 vectorized: bool = False) -> None:
+        """
+        Initialize new HashMap that uses grouped control-byte probing
+        for collision resolution
+
+        :param capacity: number of slots, rounded up to a power-of-two
+                         number of groups
+        :param function: hash function
+        :param vectorized: match control bytes with NumPy instead of
+                           bytearray.find (slower per lookup at this group
+                           size; NumPy is only imported when asked for)
+        """
+        self._numpy = None
+        if vectorized:
+            try:
+                import numpy
+            except ImportError:
+                raise ImportError("vectorized group probing requires NumPy") from None
+            self._numpy = numpy
+        self._vectorized = vectorized
+        self._hash_function = function
+        self._allocate(capacity)
+
+    def __str__(self) -> str:
+        """
+        Override string method to provide more readable output
+        """
+        out = ''
+        for i in range(self._capacity):
+            out += str(i) + ': ' + str(self._slots[i]) + '\n'
+        return out
+
+    def get_size(self) -> int:
+        """
+        Return size of map
+        """
+        return self._size
+
+    def get_capacity(self) -> int:
+        """
+        Return capacity of map
+        """
+        return self._capacity
+
+    # ------------------------------------------------------------------ #
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Replace the table with an empty one holding at least capacity slots.
+        """
+        groups = 1
+        while groups * self.GROUP_SIZE < capacity:
+            groups *= 2
+        self._groups = groups
+        self._capacity = groups * self.GROUP_SIZE
+        self._control = bytearray([self.EMPTY]) * self._capacity
+        self._view = self._numpy.frombuffer(self._control, 'u1') if self._vectorized else None
+        self._slots = DynamicArray()
+        for _ in range(self._capacity):
+            self._slots.append(None)
+        self._size = 0
+        self._deleted = 0
+
+    def _hash(self, key: str) -> tuple[int, int]:
+        """
+        Return key's (first group, 7-bit tag). The hash is spread by
+        Fibonacci hashing so that the small, clustered values of the sample
+        hash functions reach every group and every tag.
+        """
+        mixed = (hash_key(key, self._hash_function) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        return (mixed >> 32) & (self._groups - 1), (mixed >> 25) & 0x7F
+
+    def _matches(self, base: int, tag: int):
+        """
+        Yield the slot indices of group base..base+GROUP_SIZE whose control
+        byte equals tag.
+        """
+        end = base + self.GROUP_SIZE
+        if self._vectorized:
+            for offset in self._numpy.flatnonzero(self._view[base:end] == tag).tolist():
+                yield base + offset
+        else:
+            index = self._control.find(tag, base, end)
+            while index != -1:
+                yield index
+                index = self._control.find(tag, index + 1, end)
+
+    def _has_empty(self, base: int) -> bool:
+        """
+        Return True if group base..base+GROUP_SIZE has an empty slot, which
+        ends every probe sequence passing through it.
+        """
+        return self._control.find(self.EMPTY, base, base + self.GROUP_SIZE) != -1
+
+    def _find(self, key: str) -> int:
+        """
+        Return the slot index holding key, or -1 if key is not in the table.
+        """
+        group, tag = self._hash(key)
+        step = 1
+        for _ in range(self._groups):
+            base = group * self.GROUP_SIZE
+            for index in self._matches(base, tag):
+                if self._slots[index].key == key:
+                    return index
+            if self._has_empty(base):
+                return -1
+            group = (group + step) & (self._groups - 1)
+            step += 1
+        return -1
+
+    def _insert_new(self, key: str, value: object) -> None:
+        """
+        Store a key known to be absent in the first empty or deleted slot of
+        its probe sequence.
+        """
+        group, tag = self._hash(key)
+        step = 1
+        while True:
+            base = group * self.GROUP_SIZE
+            for index in range(base, base + self.GROUP_SIZE):
+                control = self._control[index]
+                if control == self.EMPTY or control == self.DELETED:
+                    if control == self.DELETED:
+                        self._deleted -= 1
+                    self._control[index] = tag
+                    self._slots[index] = HashEntry(key, value)
+                    self._size += 1
+                    return
+            group = (group + step) & (self._groups - 1)
+            step += 1
+
+    def put(self, key: str, value: object) -> None:
+        """
+        Add key/value pair to HashMap. If key already exists, update
+        its value. The table is doubled (or, when most used slots are
+        deleted ones, rebuilt at the same size) once it reaches MAX_LOAD.
+
+        :param: key (string)
+        :param: value (object of any type)
+        :return: None
+        """
+        index = self._find(key)
+        if index != -1:
+            self._slots[index].value = value
+            return
+
+        if self._size + self._deleted + 1 > self._capacity * self.MAX_LOAD:
+            if self._size + 1 > self._capacity * self.MAX_LOAD / 2:
+                self.resize_table(self._capacity * 2)
+            else:
+                self.resize_table(self._capacity)
+
+        self._insert_new(key, value)
+
+    def resize_table(self, new_capacity: int) -> None:
+        """
+        Resize table to new_capacity, rounded up to a power-of-two number
+        of groups that keeps the load under MAX_LOAD. Contents of old table
+        are rehashed into new table, dropping deleted slots.
+
+        :param: new_capacity(integer)
+        :return: None
+        """
+        if new_capacity < self._size:
+            return
+
+        new_capacity = max(new_capacity, int(self._size / self.MAX_LOAD) + 1)
+        old_slots = self._slots
+        old_capacity = self._capacity
+        self._allocate(new_capacity)
+        for index in range(old_capacity):
+            entry = old_slots[index]
+            if entry is not None:
+                self._insert_new(entry.key, entry.value)
+
+    def table_load(self) -> float:
+        """
+        Return current hash table load factor
+
+        :param: None
+        :return: float (load factor)
+        """
+        return self._size / self._capacity
+
+    def empty_buckets(self) -> int:
+        """
+        Calculate number of empty buckets
+
+        :param: none
+        :return: int (number of empty buckets)
+        """
+        return self._capacity - self._size
+
+    def get(self, key: str) -> object:
+        """
+        If the key is found return value/object associated with it,
+        otherwise return None.
+
+        :param: key (string)
+        :return: value(object of any type) if key is found, otherwise None
+        """
+        index = self._find(key)
+        if index == -1:
+            return None
+        return self._slots[index].value
+
+    def contains_key(self, key: str) -> bool:
+        """
+        Return True if key is in the HashMap, otherwise False
+
+        :param: key (string)
+        :return: bool
+        """
+        return self._find(key) != -1
+
+    def remove(self, key: str) -> None:
+        """
+        Remove key from the HashMap if present. The slot is marked empty if
+        its group still has an empty slot (no probe sequence continues past
+        such a group), and deleted otherwise.
+
+        :param: key (string)
+        :return: None
+        """
+        index = self._find(key)
+        if index == -1:
+            return
+
+        self._slots[index] = None
+        base = index - index % self.GROUP_SIZE
+        if self._has_empty(base):
+            self._control[index] = self.EMPTY
+        else:
+            self._control[index] = self.DELETED
+            self._deleted += 1
+        self._size -= 1
+
+    def get_keys_and_values(self) -> DynamicArray:
+        """
+        Returns a DynamicArray containing tuples of all key/value pairs
+        stored in HashMap
+
+        :param: None
+        :return: DynamicArray (containing tuples of key/value pairs)
+        """
+        output_arr = DynamicArray()
+        for index in range(self._capacity):
+            if self._control[index] < self.EMPTY:
+                entry = self._slots[index]
+                output_arr.append((entry.key, entry.value))
+        return output_arr
+
+    def clear(self) -> None:
+        """
+        Clears the HashMap, keeping its capacity
+
+        :param: None
+        :return: None
+        """
+        self._allocate(self._capacity)
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    from a6_include import hash_function_2
+
+    for vectorized in (False, True):
+        try:
+            m = HashMap(16, hash_function_2, vectorized)
+        except ImportError as error:
+            print(error)
+            continue
+        print("\nput / get example - vectorized:", vectorized)
+        print("-----------------------------------------")
+        for i in range(2000):
+            m.put('str' + str(i), i * 100)
+            if i % 500 == 499:
+                print(m.empty_buckets(), round(m.table_load(), 2), m.get_size(), m.get_capacity())
+        m.put('str7', 'updated')
+        result = True
+        for i in range(2000):
+            result &= m.get('str' + str(i)) == ('updated' if i == 7 else i * 100)
+            result &= not m.contains_key('miss' + str(i))
+        print(result)
+
+        for i in range(0, 2000, 2):
+            m.remove('str' + str(i))
+        m.remove('missing')
+        for i in range(2000, 3000):
+            m.put('str' + str(i), i)
+        result = all(m.contains_key('str' + str(i)) == (i % 2 == 1 or i >= 2000)
+                     for i in range(3000))
+        print(result, m.get_size(), m.get_capacity(), m.get('str2999'))
+
+    print("\nanagram keys (colliding under hash_function_1)")
+    print("----------------------------------------------")
+    m = HashMap()
+    for key in ('abc', 'acb', 'bac', 'bca', 'cab', 'cba'):
+        m.put(key, key.upper())
+    print(m.get_size(), m.get_capacity(), m.get('bca'), m.contains_key('aab'))
+
+    print("\nresize / clear example")
+    print("----------------------")
+    m = HashMap(16, hash_function_2)
+    for i in range(1, 6):
+        m.put(str(i), str(i * 10))
+    m.resize_table(200)
+    print(m.get_capacity(), m.get_keys_and_values())
+    m.clear()
+    print(m.get_size(), m.get_capacity(), m.empty_buckets())
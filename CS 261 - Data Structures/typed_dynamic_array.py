@@ -0,0 +1,153 @@
+# Name: Stefan Law
+# Course: CS261 - Data Structures
+# Description: Drop-in DynamicArray variant with typed, contiguous storage.
+# Given an array module typecode ('q', 'd', 'B', ...) elements are kept
+# unboxed in an array.array, which supports extend, zero-copy slice views,
+# buffer export and NumPy interop; without one it falls back to a Python
+# list of generic objects. Unlike DynamicArray, it is iterable, so
+# consumers can loop over it directly instead of with an index counter.
+
+from array import array
+
+from a6_include import DynamicArray, DynamicArrayException
+
+
+class TypedDynamicArray(DynamicArray):
+    """
+    Class implementing a typed Dynamic Array
+    Supported methods are:
+    append, extend, pop, swap, get_at_index, set_at_index, length,
+    view, buffer, to_numpy, iterator, reversed iterator
+    """
+
+    def __init__(self, arr=None, typecode: str = None) -> None:
+        """
+        Initialize new dynamic array from an optional iterable.
+
+        :param arr: initial elements (any iterable)
+        :param typecode: array module typecode for typed storage, or None
+                         for generic objects
+        """
+        self._typecode = typecode
+        if typecode is None:
+            self._data = list(arr) if arr is not None else []
+        else:
+            self._data = array(typecode, arr if arr is not None else ())
+
+    def __iter__(self):
+        """Return a fast iterator over the elements."""
+        return iter(self._data)
+
+    def __reversed__(self):
+        """Return a fast iterator over the elements in reverse order."""
+        return reversed(self._data)
+
+    def __str__(self) -> str:
+        """Override string method to provide more readable output."""
+        return str(list(self._data))
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Export the typed storage through the buffer protocol (3.12+)."""
+        return self.buffer()
+
+    def get_typecode(self) -> str:
+        """Return the storage typecode, or None for generic objects."""
+        return self._typecode
+
+    def get_at_index(self, index: int):
+        """Return value of element at a given index."""
+        if index < 0:
+            raise DynamicArrayException
+        try:
+            return self._data[index]
+        except IndexError:
+            raise DynamicArrayException from None
+
+    def __getitem__(self, index):
+        """
+        Return value of element at a given index using [] syntax, or a
+        view of a range of elements when given a slice.
+        """
+        if isinstance(index, slice):
+            return self.view(index)
+        return self.get_at_index(index)
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """Set value of element at a given index."""
+        if index < 0:
+            raise DynamicArrayException
+        try:
+            self._data[index] = value
+        except IndexError:
+            raise DynamicArrayException from None
+
+    def extend(self, values) -> None:
+        """
+        Append all elements of an iterable. Extending typed storage from an
+        array of the same typecode is a single memory copy.
+        """
+        self._data.extend(values)
+
+    def view(self, index: slice):
+        """
+        Return a slice of the elements. Typed storage returns a zero-copy
+        memoryview (which pins the array's size while it is alive); object
+        storage returns a new list.
+        """
+        if self._typecode is None:
+            return self._data[index]
+        return memoryview(self._data)[index]
+
+    def buffer(self) -> memoryview:
+        """
+        Return a zero-copy memoryview of typed storage. Object storage has no
+        buffer to export and raises DynamicArrayException.
+        """
+        if self._typecode is None:
+            raise DynamicArrayException
+        return memoryview(self._data)
+
+    def to_numpy(self):
+        """
+        Return a NumPy array of the elements: a zero-copy view of typed
+        storage, or an object array copied from object storage. NumPy is
+        imported here rather than with the module, so the HashMaps that use
+        this class do not pay for it.
+        """
+        try:
+            import numpy
+        except ImportError:     # NumPy is optional; only to_numpy() needs it
+            raise ImportError("to_numpy() requires NumPy") from None
+        if self._typecode is None:
+            return numpy.array(self._data, dtype=object)
+        return numpy.frombuffer(self._data, dtype=self._typecode)
+
+
+# ------------------- BASIC TESTING ---------------------------------------- #
+
+if __name__ == "__main__":
+
+    print("\ntyped storage")
+    print("-------------")
+    da = TypedDynamicArray(range(10), 'q')
+    da.append(10)
+    da.extend(array('q', [11, 12]))
+    da[0] = -1
+    print(da, da.length(), da.get_typecode(), sum(da), max(da))
+    window = da[2:5]
+    print(window.tolist(), window.nbytes, da.buffer().itemsize)
+    try:
+        da[13]
+    except DynamicArrayException:
+        print("index 13 out of range")
+    try:
+        print(da.to_numpy().mean())
+    except ImportError as error:
+        print(error)
+
+    print("\nobject storage")
+    print("--------------")
+    da = TypedDynamicArray(['apple', 'grape'])
+    da.extend(('melon', 'peach'))
+    da.swap(0, 3)
+    print(da, da.pop(), [value.upper() for value in da], da[1:])
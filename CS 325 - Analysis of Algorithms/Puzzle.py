@@ -3,98 +3,469 @@
 # Date: 11/14/2024
 
 import heapq
+from array import array
+from collections import deque
+
+try:
+    import numpy
+except ImportError:     # NumPy is optional; only the 'wavefront' engine needs it
+    numpy = None
+
+# Moves in the order neighbors are examined. A cell's entry in the search's
+# came_from array is the code (index) of the move that first reached it.
+DIRECTIONS = 'UDLR'
+
+# came_from values other than move codes
+SOURCE = 4
+BLOCKED = 254
+UNVISITED = 255
+
+# Byte translation table from board characters to initial came_from values
+_CELL_CODES = bytes(BLOCKED if char == ord('#') else UNVISITED for char in range(256))
+
+
+def _grid(board: list[list[str]]) -> tuple[bytearray, int]:
+    """
+    Convert the board to a flat row-major came_from array with a border of blocked cells: one extra row above and
+    below, and one extra column at the end of each row (which is also the cell left of the next row's first column).
+    Neighbor indices then never need bounds checks. Cell (x, y) lives at index (x + 1) * width + y.
+    :param board: m x n puzzle of "-" and "#"
+    :return: (came_from array with BLOCKED / UNVISITED cells, padded row width)
+    """
+    width = len(board[0]) + 1
+    border = '#' * width
+    cells = border + ''.join(''.join(row) + '#' for row in board) + border
+    return bytearray(cells, 'ascii', 'replace').translate(_CELL_CODES), width
+
+
+def _offsets(width: int) -> tuple[int, int, int, int]:
+    """
+    Return the flat index offset of each move, indexed by its code.
+    """
+    return -width, width, -1, 1
+
+
+def _to_cell(index: int, width: int) -> tuple[int, int]:
+    """
+    Return the board coordinates of a padded flat index.
+    """
+    row, col = divmod(index, width)
+    return row - 1, col
+
+
+def _rebuild_path(came_from: bytearray,
+                  width: int,
+                  destination: int) -> tuple[list[tuple[int, int]], str]:
+    """
+    Walk the move codes back from destination to the source and return the path of cells and its "UDLR" string.
+    O(path length), and only run once per search.
+    :param came_from: move code per cell (padded flat layout), SOURCE at the start cell
+    :param width: padded row width
+    :param destination: flat index the walk starts from
+    :return: (path, directions)
+    """
+    offsets = _offsets(width)
+    index = destination
+    path = [_to_cell(index, width)]
+    directions = []
+    code = came_from[index]
+    while code != SOURCE:
+        directions.append(DIRECTIONS[code])
+        index -= offsets[code]
+        path.append(_to_cell(index, width))
+        code = came_from[index]
+
+    path.reverse()
+    directions.reverse()
+    return path, ''.join(directions)
+
+
+def _solve_bfs(came_from: bytearray, width: int, start: int, goal: int, stats: dict) -> bool:
+    """
+    Breadth-first search engine. The frontier is a FIFO deque of flat cell indices; every cell reached records the
+    code of the move that reached it in came_from. The destination is tested when it is discovered.
+    :return: True if goal was reached
+    """
+    offsets = _offsets(width)
+    queue = deque([start])
+    expanded = 0
+
+    # Loop until queue is empty or we reach destination
+    while queue:
+        cell = queue.popleft()
+        expanded += 1
+
+        # Process neighbors of current cell: up, down, left, right
+        for code in range(4):
+            neighbor = cell + offsets[code]
+            if came_from[neighbor] == UNVISITED:
+                # Record the move that reached the neighbor; the border stops the search at the board's edges
+                came_from[neighbor] = code
+                if neighbor == goal:
+                    stats['expanded'] = expanded
+                    return True
+                queue.append(neighbor)
+
+    stats['expanded'] = expanded
+    return False
+
+
+def _solve_astar(came_from: bytearray, width: int, start: int, goal: int, stats: dict) -> bool:
+    """
+    A* search engine with the Manhattan distance to the destination as heuristic. The heap holds
+    (g + h, h, push order, cell) entries: among equal estimates the cell nearest the destination is expanded first,
+    and the push order makes the remaining ties deterministic. The heuristic is consistent, so a cell's cost is final
+    once it is expanded and the path found is a shortest one.
+    :return: True if goal was reached
+    """
+    offsets = _offsets(width)
+    goal_row, goal_col = divmod(goal, width)
+    cost = array('i', [0]) * len(came_from)
+    closed = bytearray(len(came_from))
+    row, col = divmod(start, width)
+    estimate = abs(row - goal_row) + abs(col - goal_col)
+    pq = [(estimate, estimate, 0, start)]
+    pushed = 0
+    expanded = 0
+
+    while pq:
+        priority, estimate, order, cell = heapq.heappop(pq)
+        if closed[cell]:
+            continue
+        closed[cell] = 1
+        expanded += 1
+        if cell == goal:
+            stats['expanded'] = expanded
+            return True
+
+        next_cost = cost[cell] + 1
+        for code in range(4):
+            neighbor = cell + offsets[code]
+            state = came_from[neighbor]
+            if state == BLOCKED or closed[neighbor]:
+                continue
+            if state == UNVISITED or next_cost < cost[neighbor]:
+                cost[neighbor] = next_cost
+                came_from[neighbor] = code
+                row, col = divmod(neighbor, width)
+                estimate = abs(row - goal_row) + abs(col - goal_col)
+                pushed += 1
+                heapq.heappush(pq, (next_cost + estimate, estimate, pushed, neighbor))
+
+    stats['expanded'] = expanded
+    return False
+
+
+def _solve_bidirectional(came_from: bytearray, width: int, start: int, goal: int, stats: dict) -> bool:
+    """
+    Bidirectional BFS engine. One search grows from the source (recording forward move codes in came_from) and one
+    from the destination (recording, in a second array, the move leading from each cell towards the destination:
+    the inverse, code ^ 1, of the move that reached it). Each round expands a whole layer of the smaller frontier, so
+    the first cell found by both searches lies on a shortest path. The destination's half is then written into
+    came_from, so the path can be rebuilt from the destination as usual.
+    :return: True if goal was reached
+    """
+    if came_from[goal] == BLOCKED:
+        stats['expanded'] = 0
+        return False
+    offsets = _offsets(width)
+    toward_goal = bytearray(came_from)
+    toward_goal[start] = UNVISITED
+    toward_goal[goal] = SOURCE
+    forward, backward = [start], [goal]
+    expanded = 0
+
+    while forward and backward:
+        # Expand the smaller frontier by one layer
+        if len(forward) <= len(backward):
+            layer, seen, other, invert = forward, came_from, toward_goal, 0
+        else:
+            layer, seen, other, invert = backward, toward_goal, came_from, 1
+        next_layer = []
+        for cell in layer:
+            expanded += 1
+            for code in range(4):
+                neighbor = cell + offsets[code]
+                if seen[neighbor] == UNVISITED:
+                    seen[neighbor] = code ^ invert
+                    if other[neighbor] != UNVISITED:
+                        # Both searches reached neighbor: stitch the destination's half into came_from
+                        stats['expanded'] = expanded
+                        code = toward_goal[neighbor]
+                        while code != SOURCE:
+                            neighbor += offsets[code]
+                            came_from[neighbor] = code
+                            code = toward_goal[neighbor]
+                        return True
+                    next_layer.append(neighbor)
+        if invert:
+            backward = next_layer
+        else:
+            forward = next_layer
+
+    stats['expanded'] = expanded
+    return False
+
+
+# Frontiers smaller than this are expanded cell by cell: below it, NumPy's per-call overhead costs more than it saves
+WAVEFRONT_MIN_VECTOR = 64
+
+
+def _solve_wavefront(came_from: bytearray, width: int, start: int, goal: int, stats: dict) -> bool:
+    """
+    Vectorized BFS engine (requires NumPy). came_from is viewed as a NumPy array, and the frontier is an array of
+    flat cell indices that is expanded one whole layer per step: the four shifted copies of the frontier give every
+    candidate neighbor at once, a mask keeps the unvisited open ones, and their move codes are written in one
+    assignment. A cell's move code points to a neighbor one layer closer to the source, so the usual rebuild
+    descends the distance field back to the source. Work per layer is proportional to the frontier, not the board;
+    narrow frontiers (corridors) are expanded cell by cell instead.
+    :return: True if goal was reached
+    """
+    if numpy is None:
+        raise ImportError("the 'wavefront' engine requires NumPy")
+    cells = numpy.frombuffer(came_from, dtype=numpy.uint8)
+    offsets = numpy.array(_offsets(width), dtype=numpy.intp)
+    python_offsets = _offsets(width)
+    codes = numpy.arange(4, dtype=numpy.uint8)
+    frontier = [start]
+    expanded = 0
+
+    while len(frontier):
+        expanded += len(frontier)
+        if len(frontier) < WAVEFRONT_MIN_VECTOR:
+            if not isinstance(frontier, list):
+                frontier = frontier.tolist()
+            next_layer = []
+            for cell in frontier:
+                for code in range(4):
+                    neighbor = cell + python_offsets[code]
+                    if came_from[neighbor] == UNVISITED:
+                        came_from[neighbor] = code
+                        next_layer.append(neighbor)
+            frontier = next_layer
+        else:
+            candidates = (numpy.asarray(frontier, dtype=numpy.intp)[:, None] + offsets).ravel()
+            moves = numpy.broadcast_to(codes, (len(frontier), 4)).ravel()
+            unvisited = cells[candidates] == UNVISITED
+            candidates = candidates[unvisited]
+            moves = moves[unvisited]
+            cells[candidates] = moves
+            # A cell reached from several frontier cells keeps one move code; keeping the candidate whose code was
+            # written removes the duplicates without sorting
+            frontier = candidates[cells[candidates] == moves]
+        if came_from[goal] != UNVISITED and came_from[goal] != BLOCKED:
+            stats['expanded'] = expanded
+            return True
+
+    stats['expanded'] = expanded
+    return False
+
+
+# Byte translation table from came_from values to "1" (open) / "0" (blocked) digits
+_BIT_DIGITS = bytes(ord('0') if code == BLOCKED else ord('1') for code in range(256))
+
+
+def _solve_bitboard(came_from: bytearray, width: int, start: int, goal: int, stats: dict) -> bool:
+    """
+    Bitboard BFS engine for small and medium boards. The open cells, the visited cells and each BFS layer are Python
+    ints with one bit per padded flat index, so a layer is expanded for the whole board at once:
+    ((layer << 1) | (layer >> 1) | (layer << width) | (layer >> width)) & open & ~visited. The blocked border keeps
+    shifts from wrapping between rows. The path is recovered by stepping from the destination to a neighbor set in the
+    previous layer, and its move codes are written into came_from. Keeping every layer costs
+    (board cells / 8) bytes per layer, so large boards should use another engine.
+    :return: True if goal was reached
+    """
+    offsets = _offsets(width)
+    open_cells = int(came_from.translate(_BIT_DIGITS)[::-1], 2)
+    layer = visited = 1 << start
+    layers = [layer]
+
+    while not (layer >> goal) & 1:
+        layer = ((layer << 1) | (layer >> 1) | (layer << width) | (layer >> width)) & open_cells & ~visited
+        if not layer:
+            stats['expanded'] = visited.bit_count()
+            return False
+        visited |= layer
+        layers.append(layer)
+    stats['expanded'] = visited.bit_count()
+
+    # Walk back through the layers, recording the move that reached each cell
+    cell = goal
+    for previous in reversed(layers[:-1]):
+        for code in range(4):
+            if (previous >> (cell - offsets[code])) & 1:
+                came_from[cell] = code
+                cell -= offsets[code]
+                break
+    return True
+
+
+def _jump(came_from: bytearray, width: int, cell: int, step: int, goal: int) -> int:
+    """
+    Move from cell in the direction of step (a flat offset) until reaching a jump point, and return it, or -1 when a
+    blocked cell ends the line first. A jump point is the destination, a cell with a forced neighbor (an open cell
+    beside the line whose counterpart one step back is blocked, so the shortest way there passes through this cell),
+    or, on a vertical line, a cell from which a horizontal jump finds a jump point.
+    """
+    horizontal = step == 1 or step == -1
+    side = width if horizontal else 1
+    while True:
+        cell += step
+        if came_from[cell] == BLOCKED:
+            return -1
+        if cell == goal:
+            return cell
+        if ((came_from[cell - side] != BLOCKED and came_from[cell - side - step] == BLOCKED)
+                or (came_from[cell + side] != BLOCKED and came_from[cell + side - step] == BLOCKED)):
+            return cell
+        if not horizontal and (_jump(came_from, width, cell, 1, goal) != -1
+                               or _jump(came_from, width, cell, -1, goal) != -1):
+            return cell
+
+
+def _segment(previous: int, cell: int, width: int) -> tuple[int, int]:
+    """
+    Return (move code, number of moves) of the straight segment from previous to cell.
+    """
+    if abs(cell - previous) < width:
+        return (3 if cell > previous else 2), abs(cell - previous)
+    return (1 if cell > previous else 0), abs(cell - previous) // width
+
+
+def _solve_jump_point(came_from: bytearray, width: int, start: int, goal: int, stats: dict) -> bool:
+    """
+    Jump Point Search engine for the 4-connected grid: A* with the Manhattan heuristic over jump points only. From
+    each jump point the search only continues straight ahead and turns sideways (a cell reached horizontally may
+    turn vertically and vice versa), jumping along each line with _jump instead of pushing every cell of open areas
+    through the heap. Consecutive jump points lie on straight lines, so once the destination is expanded, each
+    segment's cells receive their move codes in came_from and the path is rebuilt as usual.
+    :return: True if goal was reached
+    """
+    offsets = _offsets(width)
+    goal_row, goal_col = divmod(goal, width)
+    cost = {start: 0}
+    parent = {start: None}
+    closed = set()
+    row, col = divmod(start, width)
+    estimate = abs(row - goal_row) + abs(col - goal_col)
+    pq = [(estimate, estimate, 0, start)]
+    pushed = 0
+
+    while pq:
+        priority, estimate, order, cell = heapq.heappop(pq)
+        if cell in closed:
+            continue
+        closed.add(cell)
+        if cell == goal:
+            break
+
+        # Directions to search from cell: all four from the source, otherwise straight on and both sides
+        if parent[cell] is None:
+            codes = range(4)
+        else:
+            arrival, length = _segment(parent[cell], cell, width)
+            codes = (arrival, 2, 3) if arrival < 2 else (0, 1, arrival)
+
+        for code in codes:
+            jump_point = _jump(came_from, width, cell, offsets[code], goal)
+            if jump_point == -1 or jump_point in closed:
+                continue
+            next_cost = cost[cell] + _segment(cell, jump_point, width)[1]
+            if next_cost < cost.get(jump_point, next_cost + 1):
+                cost[jump_point] = next_cost
+                parent[jump_point] = cell
+                row, col = divmod(jump_point, width)
+                estimate = abs(row - goal_row) + abs(col - goal_col)
+                pushed += 1
+                heapq.heappush(pq, (next_cost + estimate, estimate, pushed, jump_point))
+
+    stats['expanded'] = len(closed)
+    if goal not in closed:
+        return False
+
+    # Fill in the move codes along each straight segment between jump points
+    cell = goal
+    while parent[cell] is not None:
+        previous = parent[cell]
+        code, length = _segment(previous, cell, width)
+        for index in range(1, length + 1):
+            came_from[previous + index * offsets[code]] = code
+        cell = previous
+    return True
+
+
+# Search engines selectable through solve_puzzle's engine argument
+ENGINES = {
+    'bfs': _solve_bfs,
+    'astar': _solve_astar,
+    'bidirectional': _solve_bidirectional,
+    'wavefront': _solve_wavefront,
+    'bitboard': _solve_bitboard,
+    'jump_point': _solve_jump_point,
+}
 
 
 def solve_puzzle(board: list[list[str]],
                  source: tuple[int, int],
-                 destination: tuple[int, int]) -> tuple[list[tuple[int, int]], str] | None:
+                 destination: tuple[int, int],
+                 engine: str = 'bfs',
+                 stats: dict = None,
+                 components=None) -> tuple[list[tuple[int, int]], str] | None:
     """
     Utilizes BFS to determine one of the shortest routes through an m x n puzzle containing empty cells marked "-" and
     blocked cells marked "#" from the coordinates provided by source to the coordinates provided by destination. If no
     path is found, the function returns None. If the source and destination are the same, that cell coordinate is returned.
+    Each visited cell stores only the code of the move that reached it (one byte per cell); the path and its directions
+    are rebuilt once the destination is reached. With engine='astar', A* with a Manhattan heuristic finds a shortest
+    path while expanding fewer cells when the destination is near or the board is open; engine='bidirectional'
+    searches from both ends and suits far-apart source and destination; engine='wavefront' expands whole BFS layers
+    with NumPy and suits very large boards; engine='bitboard' expands whole BFS layers as big-int bit operations and
+    suits many small boards; engine='jump_point' runs Jump Point Search and suits boards with large open areas.
     :param board:
     :param source:
     :param destination:
+    :param engine: key of ENGINES
+    :param stats: optional dict that receives the number of cells expanded under 'expanded'
+    :param components: optional connected-component labels of board (puzzle_components.BoardComponents); a query
+                       whose source and destination are not connected is rejected without searching
     :return:
     """
+    if engine not in ENGINES:
+        raise ValueError('engine must be one of ' + ', '.join(ENGINES))
+    if stats is None:
+        stats = {}
+    if components is not None and not components.connected(source, destination):
+        stats['expanded'] = 0
+        return None
 
     # Initialization
-    pq = []  # Min-heap priority queue
-    n = len(board)
-    m = len(board[0])
-    visited = [[(False, None) for col in range(m)] for row in range(n)]
-    source_x = source[0]
-    source_y = source[1]
-    path = [(source_x, source_y)]
-    heapq.heappush(pq, (0, source, path))
-    visited[source_x][source_y] = (True, path, '')
-
-    # Loop until pq is empty or we reach destination
-    while pq:
-        priority, (cell_x, cell_y), path = heapq.heappop(pq)
-        # Check if we are at our destination
-        if (cell_x, cell_y) == destination:
-            return (visited[cell_x][cell_y][1], visited[cell_x][cell_y][2])
-
-
-
-        # Process neighbors of current cell
-        # Check up
-        if cell_x - 1 >= 0 and not visited[cell_x-1][cell_y][0]:
-            if board[cell_x-1][cell_y] != '#':
-                # Push valid neighbor to queue and give it a path, mark as visited
-                new_path = path.copy()
-                new_path.append((cell_x - 1, cell_y))
-                heapq.heappush(pq, (0, (cell_x - 1, cell_y), new_path))
-                directions = visited[cell_x][cell_y][2][:]
-                directions += 'U'
-                visited[cell_x-1][cell_y] = (True, new_path, directions)
-            else:
-                visited[cell_x-1][cell_y] = (True, None)
-
-
-        # Check down
-        if cell_x + 1 < n and not visited[cell_x+1][cell_y][0]:
-            if board[cell_x+1][cell_y] != '#':
-                # Push valid neighbor to queue and give it a path, mark as visited
-                new_path = path.copy()
-                new_path.append((cell_x+1, cell_y))
-                heapq.heappush(pq, (0,(cell_x+1, cell_y),new_path))
-                directions = visited[cell_x][cell_y][2][:]
-                directions += 'D'
-                visited[cell_x+1][cell_y] = (True, new_path, directions)
-            else:
-                visited[cell_x+1][cell_y] = (True, None)
-
-                # Check left
-        if cell_y - 1 >= 0 and not visited[cell_x][cell_y-1][0]:
-            if board[cell_x][cell_y-1] != '#':
-                # Push valid neighbor to queue and give it a path, mark as visited
-                new_path = path.copy()
-                new_path.append((cell_x, cell_y-1))
-                heapq.heappush(pq, (0, (cell_x, cell_y-1), new_path))
-                directions = visited[cell_x][cell_y][2][:]
-                directions += 'L'
-                visited[cell_x][cell_y-1] = (True, new_path, directions)
-            else:
-                visited[cell_x][cell_y-1] = (True, None)
-
-        # Check right
-        if cell_y + 1 < m and not visited[cell_x][cell_y+1][0]:
-            if board[cell_x][cell_y+1] != '#':
-                # Push valid neighbor to queue and give it a path, mark as visited
-                new_path = path.copy()
-                new_path.append((cell_x, cell_y + 1))
-                heapq.heappush(pq, (0, (cell_x, cell_y + 1), new_path))
-                directions = visited[cell_x][cell_y][2][:]
-                directions += 'R'
-                visited[cell_x][cell_y+1] = (True, new_path, directions)
-            else:
-                visited[cell_x][cell_y+1] = (True, None)
-
-    # pq is empty and no valid path was found
+    came_from, width = _grid(board)
+    return _search(came_from, width, source, destination, engine, stats)
+
+
+def _search(came_from: bytearray,
+            width: int,
+            source: tuple[int, int],
+            destination: tuple[int, int],
+            engine: str,
+            stats: dict) -> tuple[list[tuple[int, int]], str] | None:
+    """
+    Run engine over a fresh came_from array from _grid (which is consumed) and return solve_puzzle's result.
+    """
+    start = (source[0] + 1) * width + source[1]
+    goal = (destination[0] + 1) * width + destination[1]
+    came_from[start] = SOURCE
+    if start == goal:
+        stats['expanded'] = 0
+        return _rebuild_path(came_from, width, goal)
+
+    if ENGINES[engine](came_from, width, start, goal, stats):
+        return _rebuild_path(came_from, width, goal)
+
+    # no valid path was found
     return None
 
+
 if __name__ == "__main__":
     puzzle = [
         ['-', '-', '-', '-', '-'],
@@ -107,3 +478,6 @@ if __name__ == "__main__":
     print(solve_puzzle(puzzle, (0, 0), (4, 4)))
     print(solve_puzzle(puzzle, (0, 0), (4, 0)))
     print(solve_puzzle(puzzle, (0, 0), (0, 0)))
+    for engine in ENGINES:
+        stats = {}
+        print(engine, solve_puzzle(puzzle, (0, 0), (4, 4), engine, stats), stats)
@@ -0,0 +1,196 @@
+# Name: Stefan Law
+# Course: CS325: Analysis of Algorithms
+# Description: Benchmark for the solve_puzzle search engines on large
+# generated boards: open boards, a random board with scattered walls, and
+# a maze (long corridors). Every result is checked to be a valid path, and
+# its number of moves is reported next to the BFS shortest path length.
+#
+# Run from this directory, e.g.:
+#   python puzzle_bench.py
+#   python puzzle_bench.py --size 1000 --boards open maze
+#   python puzzle_bench.py --size 64 --repeat 200
+
+import argparse
+import heapq
+import random
+import time
+from functools import partial
+
+from Puzzle import (DIRECTIONS, SOURCE, UNVISITED, _grid, _offsets,
+                    _rebuild_path, numpy, solve_puzzle)
+
+
+# ------------------------- BOARDS ----------------------------------------- #
+#
+# A board generator receives a size and a seeded random.Random and returns
+# (board, source, destination).
+
+def open_board(size: int, rng: random.Random) -> tuple:
+    """Board without walls, searched corner to corner."""
+    board = [['-'] * size for _ in range(size)]
+    return board, (0, 0), (size - 1, size - 1)
+
+
+def open_middle_board(size: int, rng: random.Random) -> tuple:
+    """Board without walls, searched between two points on the middle row."""
+    board = [['-'] * size for _ in range(size)]
+    return board, (size // 2, size // 4), (size // 2, size - 1 - size // 4)
+
+
+def random_board(size: int, rng: random.Random) -> tuple:
+    """Board with 25% of cells blocked (3 x 3 corner squares kept open)."""
+    board = [['#' if rng.random() < 0.25 else '-' for _ in range(size)]
+             for _ in range(size)]
+    for x in range(3):
+        for y in range(3):
+            board[x][y] = board[size - 1 - x][size - 1 - y] = '-'
+    return board, (0, 0), (size - 1, size - 1)
+
+
+def maze_board(size: int, rng: random.Random) -> tuple:
+    """
+    Perfect maze carved by a randomized depth-first search over the cells
+    with even coordinates, searched corner to corner.
+    """
+    board = [['#'] * size for _ in range(size)]
+    last = (size - 1) // 2 * 2
+    board[0][0] = '-'
+    stack = [(0, 0)]
+    while stack:
+        x, y = stack[-1]
+        options = [(x + dx, y + dy, dx // 2, dy // 2)
+                   for dx, dy in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                   if 0 <= x + dx <= last and 0 <= y + dy <= last
+                   and board[x + dx][y + dy] == '#']
+        if not options:
+            stack.pop()
+            continue
+        next_x, next_y, wall_x, wall_y = rng.choice(options)
+        board[x + wall_x][y + wall_y] = '-'
+        board[next_x][next_y] = '-'
+        stack.append((next_x, next_y))
+    return board, (0, 0), (last, last)
+
+
+BOARDS = {
+    'open': open_board,
+    'open_mid': open_middle_board,
+    'random': random_board,
+    'maze': maze_board,
+}
+
+
+# ------------------------- ENGINES ---------------------------------------- #
+
+def heap_search(board: list[list[str]],
+                source: tuple[int, int],
+                destination: tuple[int, int],
+                stats: dict) -> tuple | None:
+    """
+    The previous solve_puzzle frontier, kept as a reference: every cell is
+    pushed on a heapq with constant priority 0, so entries are ordered by
+    their coordinates rather than first in, first out, and each operation
+    costs O(log n). Its paths are not always shortest.
+    """
+    came_from, width = _grid(board)
+    offsets = _offsets(width)
+    start = (source[0] + 1) * width + source[1]
+    goal = (destination[0] + 1) * width + destination[1]
+    came_from[start] = SOURCE
+    pq = [(0, (source[0], source[1]))]
+    stats['expanded'] = 0
+    while pq:
+        priority, (cell_x, cell_y) = heapq.heappop(pq)
+        cell = (cell_x + 1) * width + cell_y
+        stats['expanded'] += 1
+        if cell == goal:
+            return _rebuild_path(came_from, width, goal)
+        for code in range(4):
+            neighbor = cell + offsets[code]
+            if came_from[neighbor] == UNVISITED:
+                came_from[neighbor] = code
+                heapq.heappush(pq, (0, divmod(neighbor - width, width)))
+    return None
+
+
+# Name -> callable(board, source, destination, stats)
+ENGINES = {
+    'heap': heap_search,
+    'bfs': partial(solve_puzzle, engine='bfs'),
+    'astar': partial(solve_puzzle, engine='astar'),
+    'bidirectional': partial(solve_puzzle, engine='bidirectional'),
+}
+if numpy is not None:
+    ENGINES['wavefront'] = partial(solve_puzzle, engine='wavefront')
+ENGINES['bitboard'] = partial(solve_puzzle, engine='bitboard')
+ENGINES['jump_point'] = partial(solve_puzzle, engine='jump_point')
+
+# Largest board side each memory-hungry engine is run on
+ENGINE_MAX_SIZE = {
+    'bitboard': 256,
+}
+
+
+def check_path(board: list[list[str]],
+               source: tuple[int, int],
+               destination: tuple[int, int],
+               result: tuple) -> int:
+    """
+    Verify that result is a (path, directions) pair walking open cells from
+    source to destination, and return its number of moves.
+    """
+    path, directions = result
+    assert path[0] == tuple(source) and path[-1] == tuple(destination)
+    assert len(directions) == len(path) - 1
+    moves = dict(zip(DIRECTIONS, ((-1, 0), (1, 0), (0, -1), (0, 1))))
+    for (x, y), (next_x, next_y), direction in zip(path, path[1:], directions):
+        assert (next_x - x, next_y - y) == moves[direction]
+        assert board[next_x][next_y] != '#'
+    return len(directions)
+
+
+def run(boards: list, engines: list, size: int, seed: int, repeat: int = 1) -> None:
+    """
+    Time every engine on every board and print one row per pair. The time
+    is the mean over repeat solves of the same board.
+    """
+    print(f"{'board':<10}{'engine':<15}{'seconds':>10}{'moves':>8}"
+          f"{'expanded':>10}{'speedup':>9}")
+    for board_name in boards:
+        board, source, destination = BOARDS[board_name](size, random.Random(seed))
+        shortest = None
+        baseline = None
+        for engine in engines:
+            if size > ENGINE_MAX_SIZE.get(engine, size):
+                continue
+            stats = {}
+            start = time.perf_counter()
+            for _ in range(repeat):
+                result = ENGINES[engine](board, source, destination, stats=stats)
+            elapsed = (time.perf_counter() - start) / repeat
+            moves = check_path(board, source, destination, result) if result else None
+            if engine == 'bfs':
+                shortest = moves
+            baseline = baseline or elapsed
+            print(f"{board_name:<10}{engine:<15}{elapsed:>10.5f}{str(moves):>8}"
+                  f"{stats['expanded']:>10}{baseline / elapsed:>8.1f}x")
+        if shortest is not None:
+            print(f"{'':<10}shortest path: {shortest} moves")
+
+
+def main() -> None:
+    """Parse command line options and run the benchmark."""
+    parser = argparse.ArgumentParser(description='Benchmark solve_puzzle engines.')
+    parser.add_argument('--size', type=int, default=1000,
+                        help='board side length (default 1000)')
+    parser.add_argument('--seed', type=int, default=325)
+    parser.add_argument('--boards', nargs='+', choices=BOARDS, default=list(BOARDS))
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=list(ENGINES))
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='solves per board and engine (default 1)')
+    args = parser.parse_args()
+    run(args.boards, args.engines, args.size, args.seed, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# Name: Stefan Law
+# Course: CS325: Analysis of Algorithms
+# Description: Connected-component labels for a puzzle board, so that
+# solve_puzzle can reject a query whose source and destination lie in
+# different regions without searching the whole source region first. Labels
+# are kept in a union-find (disjoint set) structure over the board's cells:
+# it is built with a scanline pass that unions whole runs of open cells, and
+# opening a cell later only unions it with its open neighbors.
+
+import re
+from array import array
+
+from Puzzle import BLOCKED, UNVISITED, _grid, _offsets
+
+# Runs of open cells in a row of the came_from grid
+_OPEN_RUN = re.compile(b'[^%c]+' % BLOCKED)
+
+
+class BoardComponents:
+    """
+    Union-find connected-component labels over an m x n board of "-" and "#".
+    Supported methods are: connected, label, open_cell, get_component_count
+    """
+
+    def __init__(self, board: list[list[str]]) -> None:
+        """
+        Label the open cells of board by connected component. O(cells) to convert the board; the unions run once per
+        run of open cells and once per pair of touching runs in adjacent rows.
+        :param board: m x n puzzle of "-" and "#"; open it through open_cell so the labels stay current
+        """
+        self._board = board
+        self._cells, self._width = _grid(board)
+        self._offsets = _offsets(self._width)
+        self._parent = array('i', range(len(self._cells)))
+        self._rank = bytearray(len(self._cells))
+        self._components = 0
+
+        width = self._width
+        above = []
+        for row in range(1, len(board) + 1):
+            runs = []
+            for run in _OPEN_RUN.finditer(self._cells, row * width, (row + 1) * width):
+                first, end = run.span()
+                # Every cell of a run joins the run's first cell
+                self._parent[first + 1:end] = array('i', [first]) * (end - first - 1)
+                self._components += 1
+                runs.append((first, end))
+
+            # Union each run with the runs of the row above that it touches
+            i = 0
+            for first, end in runs:
+                while i < len(above) and above[i][1] + width <= first:
+                    i += 1
+                j = i
+                while j < len(above) and above[j][0] + width < end:
+                    self._union(first, above[j][0])
+                    j += 1
+            above = runs
+
+    def _find(self, index: int) -> int:
+        """
+        Return the root of index's set, halving the path on the way.
+        """
+        parent = self._parent
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def _union(self, first: int, second: int) -> None:
+        """
+        Merge the sets of two open cells (union by rank).
+        """
+        first, second = self._find(first), self._find(second)
+        if first == second:
+            return
+        if self._rank[first] < self._rank[second]:
+            first, second = second, first
+        self._parent[second] = first
+        if self._rank[first] == self._rank[second]:
+            self._rank[first] += 1
+        self._components -= 1
+
+    def _index(self, cell: tuple[int, int]) -> int:
+        """
+        Return the padded flat index of board coordinates.
+        """
+        return (cell[0] + 1) * self._width + cell[1]
+
+    def label(self, cell: tuple[int, int]) -> int | None:
+        """
+        Return the component label of an open cell (equal labels mean connected), or None for a blocked cell.
+        Labels may change when open_cell merges components.
+        """
+        index = self._index(cell)
+        if self._cells[index] == BLOCKED:
+            return None
+        return self._find(index)
+
+    def get_component_count(self) -> int:
+        """
+        Return the number of connected regions of open cells.
+        """
+        return self._components
+
+    def connected(self, source: tuple[int, int], destination: tuple[int, int]) -> bool:
+        """
+        Return True if solve_puzzle can find a route from source to destination. Nearly O(1). A blocked source can
+        still be left through any open neighbor, as in solve_puzzle.
+        """
+        start, goal = self._index(source), self._index(destination)
+        if start == goal:
+            return True
+        if self._cells[goal] == BLOCKED:
+            return False
+        root = self._find(goal)
+        if self._cells[start] != BLOCKED:
+            return self._find(start) == root
+        return any(self._cells[start + offset] != BLOCKED and self._find(start + offset) == root
+                   for offset in self._offsets)
+
+    def open_cell(self, cell: tuple[int, int]) -> None:
+        """
+        Mark a blocked cell open, on the board and in the labels, joining it to its open neighbors. Nearly O(1).
+        (Blocking a cell can split a component and is not supported; build a new BoardComponents instead.)
+        """
+        index = self._index(cell)
+        if self._cells[index] != BLOCKED:
+            return
+        self._board[cell[0]][cell[1]] = '-'
+        self._cells[index] = UNVISITED
+        self._parent[index] = index
+        self._rank[index] = 0
+        self._components += 1
+        for offset in self._offsets:
+            if self._cells[index + offset] != BLOCKED:
+                self._union(index, index + offset)
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from Puzzle import solve_puzzle
+
+    puzzle = [
+        ['-', '-', '-', '-', '-'],
+        ['-', '-', '#', '-', '-'],
+        ['-', '-', '-', '-', '-'],
+        ['#', '-', '#', '#', '-'],
+        ['-', '#', '-', '-', '-']
+    ]
+    components = BoardComponents(puzzle)
+    print(components.get_component_count(), components.connected((0, 0), (4, 4)),
+          components.connected((0, 0), (4, 0)), components.label((3, 0)))
+    print(solve_puzzle(puzzle, (0, 0), (4, 0), components=components))
+    components.open_cell((3, 0))
+    print(components.get_component_count(), components.connected((0, 0), (4, 0)))
+    print(solve_puzzle(puzzle, (0, 0), (4, 0), components=components))
+
+    # A board split in two by a wall: impossible queries explore a whole half
+    size = 600
+    rng = random.Random(325)
+    board = [['#' if rng.random() < 0.2 else '-' for _ in range(size)] for _ in range(size)]
+    for row in board:
+        row[size // 2] = '#'
+    start = time.perf_counter()
+    components = BoardComponents(board)
+    built = time.perf_counter() - start
+    queries = [((rng.randrange(size), rng.randrange(size // 2)),
+                (rng.randrange(size), size // 2 + 1 + rng.randrange(size // 2 - 1))) for _ in range(20)]
+    start = time.perf_counter()
+    plain = [solve_puzzle(board, source, destination) for source, destination in queries]
+    searched = time.perf_counter() - start
+    start = time.perf_counter()
+    rejected = [solve_puzzle(board, source, destination, components=components) for source, destination in queries]
+    labelled = time.perf_counter() - start
+    print(plain == rejected, components.get_component_count(),
+          f"build {built:.2f}s, 20 queries: search {searched:.2f}s, with labels {labelled:.2f}s")
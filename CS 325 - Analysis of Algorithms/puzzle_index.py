@@ -0,0 +1,196 @@
+# Name: Stefan Law
+# Course: CS325: Analysis of Algorithms
+# Description: Reusable shortest-path index for answering many solve_puzzle
+# queries on one static board. The board is converted once; for each
+# destination queried, a single BFS from the destination records every
+# cell's distance to it and the move that leads one step closer. Any source
+# is then answered by following those moves, in O(path length). The fields
+# of the most recently used destinations are kept, least recently used
+# first out.
+
+from array import array
+from collections import OrderedDict, deque
+
+from Puzzle import (BLOCKED, DIRECTIONS, SOURCE, UNVISITED, _grid, _offsets,
+                    _to_cell)
+
+
+class PuzzleIndex:
+    """
+    Distance / next-step field cache over one m x n board of "-" and "#".
+    Supported methods are: solve, distance, get_stats, clear
+    """
+
+    def __init__(self, board: list[list[str]], max_fields: int = 8) -> None:
+        """
+        Convert board once. The board must not change while the index is in use.
+        :param board: m x n puzzle of "-" and "#"
+        :param max_fields: number of destination fields kept (each costs 5 bytes per cell)
+        """
+        self._cells, self._width = _grid(board)
+        self._offsets = _offsets(self._width)
+        self._max_fields = max_fields
+        self._fields = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _index(self, cell: tuple[int, int]) -> int:
+        """
+        Return the padded flat index of board coordinates.
+        """
+        return (cell[0] + 1) * self._width + cell[1]
+
+    def _build_field(self, goal: int) -> tuple[bytearray, array]:
+        """
+        BFS from goal over the board. Returns the next-step field (for every reached cell, the code of the move
+        leading one step closer to goal: the inverse, code ^ 1, of the move that reached it; SOURCE at goal) and the
+        distance field (-1 where goal cannot be reached).
+        """
+        steps = bytearray(self._cells)
+        distances = array('i', [-1]) * len(steps)
+        if steps[goal] == BLOCKED:
+            return steps, distances
+        steps[goal] = SOURCE
+        distances[goal] = 0
+        offsets = self._offsets
+        queue = deque([goal])
+        while queue:
+            cell = queue.popleft()
+            distance = distances[cell] + 1
+            for code in range(4):
+                neighbor = cell + offsets[code]
+                if steps[neighbor] == UNVISITED:
+                    steps[neighbor] = code ^ 1
+                    distances[neighbor] = distance
+                    queue.append(neighbor)
+        return steps, distances
+
+    def _field(self, destination: tuple[int, int]) -> tuple[bytearray, array]:
+        """
+        Return the fields of destination, building them on a miss and evicting the least recently used fields.
+        """
+        goal = self._index(destination)
+        fields = self._fields.get(goal)
+        if fields is not None:
+            self._hits += 1
+            self._fields.move_to_end(goal)
+            return fields
+
+        self._misses += 1
+        fields = self._build_field(goal)
+        self._fields[goal] = fields
+        if len(self._fields) > self._max_fields:
+            self._fields.popitem(last=False)
+            self._evictions += 1
+        return fields
+
+    def _first_cell(self, start: int, steps: bytearray, distances: array) -> tuple[int, int]:
+        """
+        Return (cell, move code) of the first step from start: start itself (code None) when it is open, or, for a
+        blocked source (which solve_puzzle may still leave), its nearest reached neighbor in "UDLR" order.
+        Cell is -1 if the destination cannot be reached.
+        """
+        if steps[start] != BLOCKED:
+            return (start, None) if distances[start] >= 0 else (-1, None)
+        best, best_code = -1, None
+        for code in range(4):
+            neighbor = start + self._offsets[code]
+            if distances[neighbor] >= 0 and (best == -1 or distances[neighbor] < distances[best]):
+                best, best_code = neighbor, code
+        return best, best_code
+
+    def solve(self,
+              source: tuple[int, int],
+              destination: tuple[int, int]) -> tuple[list[tuple[int, int]], str] | None:
+        """
+        Return a shortest route from source to destination in solve_puzzle's format, (path of cells, "UDLR" string),
+        or None if there is none. O(path length) once destination's field is cached.
+        :param source:
+        :param destination:
+        :return:
+        """
+        start = self._index(source)
+        if start == self._index(destination):
+            return [tuple(source)], ''
+        steps, distances = self._field(destination)
+        cell, code = self._first_cell(start, steps, distances)
+        if cell == -1:
+            return None
+
+        path = [tuple(source)]
+        directions = []
+        if code is not None:
+            directions.append(DIRECTIONS[code])
+            path.append(_to_cell(cell, self._width))
+        code = steps[cell]
+        while code != SOURCE:
+            directions.append(DIRECTIONS[code])
+            cell += self._offsets[code]
+            path.append(_to_cell(cell, self._width))
+            code = steps[cell]
+        return path, ''.join(directions)
+
+    def distance(self, source: tuple[int, int], destination: tuple[int, int]) -> int | None:
+        """
+        Return the number of moves on a shortest route from source to destination, or None if there is none.
+        O(1) once destination's field is cached.
+        """
+        start = self._index(source)
+        if start == self._index(destination):
+            return 0
+        steps, distances = self._field(destination)
+        cell, code = self._first_cell(start, steps, distances)
+        if cell == -1:
+            return None
+        return distances[cell] + (code is not None)
+
+    def get_stats(self) -> dict:
+        """
+        Return field cache counters: hits, misses, evictions and the number of fields currently cached.
+        """
+        return {'hits': self._hits, 'misses': self._misses,
+                'evictions': self._evictions, 'cached': len(self._fields)}
+
+    def clear(self) -> None:
+        """
+        Drop all cached fields.
+        """
+        self._fields.clear()
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from Puzzle import solve_puzzle
+
+    puzzle = [
+        ['-', '-', '-', '-', '-'],
+        ['-', '-', '#', '-', '-'],
+        ['-', '-', '-', '-', '-'],
+        ['#', '-', '#', '#', '-'],
+        ['-', '#', '-', '-', '-']
+    ]
+    index = PuzzleIndex(puzzle, max_fields=2)
+    print(index.solve((0, 2), (2, 2)))
+    print(index.solve((0, 0), (4, 4)), index.distance((0, 0), (4, 4)))
+    print(index.solve((0, 0), (4, 0)), index.distance((0, 0), (4, 0)))
+    print(index.solve((0, 0), (0, 0)))
+    print(index.get_stats())
+
+    rng = random.Random(325)
+    size = 200
+    board = [['#' if rng.random() < 0.25 else '-' for _ in range(size)] for _ in range(size)]
+    queries = [((rng.randrange(size), rng.randrange(size)), (rng.randrange(2), rng.randrange(2)))
+               for _ in range(100)]
+    start = time.perf_counter()
+    expected = [solve_puzzle(board, source, destination) for source, destination in queries]
+    searched = time.perf_counter() - start
+    index = PuzzleIndex(board)
+    start = time.perf_counter()
+    answers = [index.solve(source, destination) for source, destination in queries]
+    indexed = time.perf_counter() - start
+    print(all((a is None and b is None) or (a and b and len(a[1]) == len(b[1]))
+              for a, b in zip(answers, expected)),
+          f"solve_puzzle {searched:.2f}s, PuzzleIndex {indexed:.2f}s", index.get_stats())
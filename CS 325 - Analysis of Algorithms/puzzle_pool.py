@@ -0,0 +1,187 @@
+# Name: Stefan Law
+# Course: CS325: Analysis of Algorithms
+# Description: Batch solving of many independent solve_puzzle jobs across a
+# pool of worker processes. Each distinct board is converted to its came_from
+# grid once and copied into a shared memory block; jobs are sent in chunks of
+# queries that only name their board's block, which a worker maps for the
+# length of the chunk, so a board's cells never travel through the task
+# queue. A bounded number of chunks is in flight at a time, each block lives
+# only while a chunk in flight uses it, and results come back in job order
+# as they are ready.
+
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing.shared_memory import SharedMemory
+
+from Puzzle import ENGINES, _grid, _search
+
+# Chunks in flight per worker: enough to keep every worker busy while the
+# results of the oldest chunk are being handed out
+CHUNKS_PER_WORKER = 2
+
+# Converted grids kept by the in-process path, most recently used last
+INLINE_GRIDS = 16
+
+
+def _solve_chunk(engine: str, chunk: list[tuple]) -> list:
+    """
+    Worker side: solve a chunk of (board block name, grid size, width, source, destination) queries. Each block is
+    mapped once for the chunk and closed afterwards; each query searches a private copy of its board's grid.
+    """
+    attached = {}
+    results = []
+    try:
+        for name, size, width, source, destination in chunk:
+            block = attached.get(name)
+            if block is None:
+                block = attached[name] = SharedMemory(name)
+            came_from = bytearray(block.buf[:size])
+            results.append(_search(came_from, width, source, destination, engine, {}))
+    finally:
+        for block in attached.values():
+            block.close()
+    return results
+
+
+def _solve_inline(jobs, engine: str):
+    """
+    Solve jobs in this process, converting each board once while it stays among the INLINE_GRIDS most recently used.
+    """
+    grids = OrderedDict()
+    for board, source, destination in jobs:
+        grid = grids.get(id(board))
+        if grid is None:
+            # The board is kept with its grid so that its id is not reused while cached
+            grid = grids[id(board)] = (board,) + _grid(board)
+            if len(grids) > INLINE_GRIDS:
+                grids.popitem(last=False)
+        else:
+            grids.move_to_end(id(board))
+        yield _search(bytearray(grid[1]), grid[2], source, destination, engine, {})
+
+
+def solve_many(jobs,
+               workers: int = None,
+               engine: str = 'bfs',
+               chunk_size: int = 256):
+    """
+    Solve an iterable of (board, source, destination) jobs on a pool of worker processes and yield solve_puzzle's
+    result for each job, in job order. Jobs are read lazily, so the iterable may be a generator of any length.
+    Boards are told apart by identity: reuse the same board object for queries on the same board, and do not change
+    a board while its jobs are being solved. A board is held in shared memory while chunks in flight use it, so
+    memory and open files stay bounded however many distinct boards the stream holds; keeping a board's jobs
+    together lets it be converted and shared once.
+    :param jobs: iterable of (board, source, destination) tuples
+    :param workers: number of worker processes (default: os.cpu_count()); 1 solves in this process
+    :param engine: key of Puzzle.ENGINES, used for every job
+    :param chunk_size: number of queries sent to a worker at a time
+    :return: generator of (path of cells, "UDLR" string) or None per job
+    """
+    if engine not in ENGINES:
+        raise ValueError('engine must be one of ' + ', '.join(ENGINES))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        yield from _solve_inline(jobs, engine)
+        return
+
+    # id(board) -> [board, block, grid size, width, chunks in flight using it]; the board is kept so that its id is
+    # not reused while the block exists
+    blocks = {}
+
+    def chunks():
+        """
+        Group jobs into chunks of queries, copying each board not already shared into shared memory. Yields
+        (chunk, ids of the boards it uses), each board counted once per chunk.
+        """
+        jobs_left = iter(jobs)
+        while True:
+            chunk = []
+            used = set()
+            for board, source, destination in islice(jobs_left, chunk_size):
+                entry = blocks.get(id(board))
+                if entry is None:
+                    grid, width = _grid(board)
+                    block = SharedMemory(create=True, size=len(grid))
+                    block.buf[:len(grid)] = grid
+                    entry = blocks[id(board)] = [board, block, len(grid), width, 0]
+                if id(board) not in used:
+                    used.add(id(board))
+                    entry[4] += 1
+                chunk.append((entry[1].name, entry[2], entry[3], source, destination))
+            if not chunk:
+                return
+            yield chunk, used
+
+    def release(used: set) -> None:
+        """Drop a finished chunk's hold on its boards, freeing blocks no chunk in flight uses."""
+        for board_id in used:
+            entry = blocks[board_id]
+            entry[4] -= 1
+            if entry[4] == 0:
+                del blocks[board_id]
+                entry[1].close()
+                entry[1].unlink()
+
+    def results():
+        """Yield the oldest chunk's results once it is done, then release its boards."""
+        future, used = pending.popleft()
+        try:
+            return future.result()
+        finally:
+            release(used)
+
+    pending = deque()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            try:
+                for chunk, used in chunks():
+                    pending.append((pool.submit(_solve_chunk, engine, chunk), used))
+                    if len(pending) >= workers * CHUNKS_PER_WORKER:
+                        yield from results()
+                while pending:
+                    yield from results()
+            finally:
+                # Stop queued chunks if the caller stops early or a job fails
+                for future, used in pending:
+                    future.cancel()
+    finally:
+        for board, block, size, width, in_flight in blocks.values():
+            block.close()
+            block.unlink()
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from Puzzle import solve_puzzle
+
+    puzzle = [
+        ['-', '-', '-', '-', '-'],
+        ['-', '-', '#', '-', '-'],
+        ['-', '-', '-', '-', '-'],
+        ['#', '-', '#', '#', '-'],
+        ['-', '#', '-', '-', '-']
+    ]
+    small_jobs = [(puzzle, (0, 2), (2, 2)), (puzzle, (0, 0), (4, 4)),
+                  (puzzle, (0, 0), (4, 0)), (puzzle, (0, 0), (0, 0))]
+    for result in solve_many(small_jobs, workers=2, chunk_size=1):
+        print(result)
+
+    # A few boards, many queries each
+    rng = random.Random(325)
+    size = 100
+    boards = [[['#' if rng.random() < 0.25 else '-' for _ in range(size)] for _ in range(size)]
+              for _ in range(4)]
+    jobs = [(rng.choice(boards), (rng.randrange(size), rng.randrange(size)),
+             (rng.randrange(size), rng.randrange(size))) for _ in range(500)]
+    start = time.perf_counter()
+    expected = [solve_puzzle(board, source, destination) for board, source, destination in jobs]
+    print(f"solve_puzzle loop: {time.perf_counter() - start:.2f}s")
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        answers = list(solve_many(jobs, workers=workers))
+        print(f"solve_many, {workers} workers: {time.perf_counter() - start:.2f}s", answers == expected)